@@ -8,7 +8,11 @@ import datetime
 import json
 import os
 import sys
+import threading
 import time
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import islice, zip_longest
 
 # ---------------------------------------------------------------------------
 # Ensure the repo root is on sys.path so `gcs.*` and `app.*` imports work
@@ -41,9 +45,16 @@ from kivy.clock import Clock  # noqa: E402
 from kivy.metrics import dp  # noqa: E402
 from kivy.lang import Builder  # noqa: E402
 from kivy.uix.boxlayout import BoxLayout  # noqa: E402
+from kivy.uix.button import Button  # noqa: E402
+from kivy.uix.checkbox import CheckBox  # noqa: E402
+from kivy.uix.label import Label  # noqa: E402
+from kivy.uix.popup import Popup  # noqa: E402
+from kivy.uix.scrollview import ScrollView  # noqa: E402
 from kivy.uix.tabbedpanel import TabbedPanel, TabbedPanelItem  # noqa: E402,F401
 from kivy.uix.screenmanager import ScreenManager, Screen, SlideTransition  # noqa: E402
-from kivy.properties import StringProperty, ListProperty, BooleanProperty  # noqa: E402
+from kivy.properties import (  # noqa: E402
+    StringProperty, ListProperty, BooleanProperty, ColorProperty,
+)
 
 from gcs.logutil import setup_logging, get_logger  # noqa: E402
 from gcs.event_bus import EventBus, EventType  # noqa: E402
@@ -53,7 +64,10 @@ from gcs.sim_telemetry import SimTelemetry  # noqa: E402
 from app.hud_widget import FlightHUD  # noqa: E402,F401
 from app.plot_widget import TimeSeriesPlot, ProfilePlot  # noqa: E402,F401
 from app.map_widget import MapWidget  # noqa: E402,F401
-from app.theme import get_color, set_theme, get_theme_name, THEME_NAMES  # noqa: E402
+from app.theme import (  # noqa: E402
+    get_color, get_theme_dict, set_theme, get_theme_name, THEME_NAMES,
+    MISSING_COLOR,
+)
 
 # ---------------------------------------------------------------------------
 # Platform detection
@@ -74,7 +88,7 @@ except ImportError:
     DEFAULT_IP = "0.0.0.0"
     DEFAULT_CONN_TYPE = "udpin"
 
-CONN_TYPES = ["udpin", "udpout", "tcp"]
+CONN_TYPES = ("udpin", "udpout", "tcp")
 
 # Connection presets — (display_name, conn_type, ip, port)
 # "Custom" is a special sentinel: empty fields signal the UI to show
@@ -86,10 +100,11 @@ CONNECTION_PRESETS = [
     ("SITL (mav-enabled)",  "udp",  "127.0.0.1", "14560"),
     ("Custom", "", "", ""),
 ]
-PRESET_NAMES = [p[0] for p in CONNECTION_PRESETS]
+PRESET_NAMES = tuple(p[0] for p in CONNECTION_PRESETS)
 PRESET_MAP = {p[0]: p[1:] for p in CONNECTION_PRESETS}
 
 UI_UPDATE_HZ = 10
+UI_IDLE_HZ = 2  # while connected but no vehicle heartbeat is being heard
 
 setup_logging()
 log = get_logger("app")
@@ -102,6 +117,22 @@ log = get_logger("app")
 # On Android the file lives in external storage so it survives app updates;
 # on desktop it lives in the repo root for easy access.
 
+# orjson is an optional speed-up for settings (de)serialization; the
+# stdlib json module is used when it isn't installed (e.g. on Android).
+try:
+    import orjson
+
+    def _json_dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data):
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    _json_loads = json.loads
+
+
 def _android_storage_base():
     """Return the user-visible storage base on Android, with fallback.
 
@@ -127,22 +158,40 @@ def _settings_path():
     return os.path.join(_REPO_ROOT, "settings.json")
 
 
-def _load_settings():
-    p = _settings_path()
-    if os.path.exists(p):
-        try:
-            with open(p, "r") as f:
-                return json.load(f)
-        except Exception:
-            pass
+def _load_settings(p):
+    # Open directly instead of checking os.path.exists() first — saves a
+    # stat() on slow Android storage; a missing file just means defaults.
+    try:
+        with open(p, "rb") as f:
+            return _json_loads(f.read())
+    except Exception:
+        pass  # missing or unreadable file
     return {}  # empty dict means all defaults will be used
 
 
-def _save_settings(data):
-    p = _settings_path()
-    os.makedirs(os.path.dirname(p), exist_ok=True)
-    with open(p, "w") as f:
-        json.dump(data, f, indent=2)
+# Changes are coalesced: the app marks settings dirty and writes them at
+# most once per this many seconds (and on pause/stop).
+SETTINGS_SAVE_DELAY_S = 2.0
+
+# Serialized bytes of the last successful save, so re-saving unchanged
+# settings (e.g. reconnecting with the same preset) skips the disk write.
+_last_saved_blob = None
+
+
+def _save_settings(data, p):
+    # The parent directory is created once at startup (see build()), so
+    # saving is a plain open + write with no extra mkdir/stat syscalls.
+    # Written to a temp file and swapped in with os.replace() so a crash
+    # or power loss mid-write never leaves a truncated settings file.
+    global _last_saved_blob
+    blob = _json_dumps(data)
+    if blob == _last_saved_blob:
+        return
+    tmp = p + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(blob)
+    os.replace(tmp, p)
+    _last_saved_blob = blob
 
 
 # KV file path — loaded after all Screen class definitions so the KV
@@ -163,6 +212,22 @@ class GCSRoot(BoxLayout):
     pass
 
 
+class _VisibleScreen(Screen):
+    """Screen whose update() is a no-op while it is not on display.
+
+    update_ui() only drives the current screen, but this also guards
+    against indirect calls doing history loops for a hidden tab.
+    """
+
+    _visible = False
+
+    def on_pre_enter(self, *args):
+        self._visible = True
+
+    def on_leave(self, *args):
+        self._visible = False
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Connection Screen
 # ═══════════════════════════════════════════════════════════════════════════
@@ -174,9 +239,20 @@ class ConnectionScreen(Screen):
     that reveals editable fields for manual connection setup.
     """
 
+    def on_kv_post(self, base_widget):
+        super().on_kv_post(base_widget)
+        # Cache app-level handles once instead of calling
+        # App.get_running_app() from every callback and update tick.
+        self.app = App.get_running_app()
+        self.mav = self.app.mav_client
+        self.sim = self.app.sim
+        # Status labels are rewritten from update(); resolve them once
+        self._status_label = self.ids.status_label
+        self._detail_label = self.ids.detail_label
+
     def on_enter(self):
         # Restore last-used settings into UI widgets
-        app = App.get_running_app()
+        app = self.app
         settings = app.settings_data
         # Restore custom fields
         self.ids.conn_type_spinner.text = settings.get("last_conn_type", DEFAULT_CONN_TYPE)
@@ -198,12 +274,13 @@ class ConnectionScreen(Screen):
         """
         box = self.ids.get("custom_conn_box")
         if box:
-            if preset_name == "Custom":
-                box.height = dp(44)
-                box.opacity = 1
-            else:
-                box.height = 0
-                box.opacity = 0
+            # Switching between two named presets leaves the box collapsed;
+            # only touch it (and re-run the layout) when visibility flips.
+            custom = preset_name == "Custom"
+            height = dp(44) if custom else 0
+            if box.height != height:
+                box.height = height
+                box.opacity = 1 if custom else 0
 
     # ── Hold-to-disconnect safety pattern ─────────────────────────────
     # Prevents accidental disconnects: user must press and hold the
@@ -214,8 +291,7 @@ class ConnectionScreen(Screen):
     _hold_event = None
 
     def on_connect_press(self):
-        app = App.get_running_app()
-        if app.mav_client.running:
+        if self.mav.running:
             # Start 1-second hold timer for disconnect
             self.ids.connect_btn.text = "Hold to disconnect…"
             self._hold_event = Clock.schedule_once(
@@ -223,7 +299,7 @@ class ConnectionScreen(Screen):
         # For connect / demo-stop, action happens on release (not press)
 
     def on_connect_release(self):
-        app = App.get_running_app()
+        app = self.app
         if self._hold_event is not None:
             # Released before 1s — cancel the disconnect attempt
             self._hold_event.cancel()
@@ -239,15 +315,10 @@ class ConnectionScreen(Screen):
 
     def _on_hold_complete(self):
         self._hold_event = None
-        app = App.get_running_app()
-        if app.mav_client.running:
-            self._confirm_disconnect(app)
+        if self.mav.running:
+            self._confirm_disconnect(self.app)
 
     def _confirm_disconnect(self, app):
-        from kivy.uix.popup import Popup
-        from kivy.uix.label import Label
-        from kivy.uix.button import Button
-
         content = BoxLayout(orientation='vertical', padding=10, spacing=10)
         content.add_widget(Label(
             text='Are you sure you want to disconnect\nfrom the vehicle?',
@@ -276,7 +347,7 @@ class ConnectionScreen(Screen):
         popup.open()
 
     def on_demo_toggle(self, active):
-        app = App.get_running_app()
+        app = self.app
         if active:
             # Stop real connection if running
             if app.mav_client.running:
@@ -306,12 +377,14 @@ class ConnectionScreen(Screen):
             ip = self.ids.ip_input.text.strip() or DEFAULT_IP
             port = self.ids.port_input.text.strip() or str(DEFAULT_PORT)
 
-        # Persist connection settings so they restore on next launch
+        # Persist connection settings so they restore on next launch.
+        # The write is deferred to the next frame so file I/O doesn't
+        # delay the connect click; on_stop flushes again as a backstop.
         app.settings_data["last_preset"] = preset_name
         app.settings_data["last_conn_type"] = conn_type
         app.settings_data["last_ip"] = ip
         app.settings_data["last_port"] = int(port)
-        _save_settings(app.settings_data)
+        app.mark_settings_dirty()
 
         conn_str = f"{conn_type}:{ip}:{port}"
         self._set_status(
@@ -342,40 +415,56 @@ class ConnectionScreen(Screen):
 
     def _start_ui_refresh(self, app):
         if app.update_event is None:
-            app.update_event = Clock.schedule_interval(
-                app.update_ui, 1.0 / UI_UPDATE_HZ
-            )
+            app.set_ui_rate(UI_UPDATE_HZ)
 
     def _stop_ui_refresh(self, app):
         if app.update_event is not None:
             app.update_event.cancel()
             app.update_event = None
 
+    # Key of the values behind the status currently shown by update()
+    # (branch plus the numbers its detail line displays).  Lets update()
+    # skip rebuilding the detail string — and re-rendering the Label
+    # texture — when nothing visible has changed.
+    _last_status_key = None
+
     def _set_status(self, status, color, detail):
-        self.ids.status_label.text = status
-        self.ids.status_label.color = color
-        self.ids.detail_label.text = detail
+        self._last_status_key = None
+        self._status_label.text = status
+        self._status_label.color = color
+        self._detail_label.text = detail
 
     def update(self, state):
         """Called periodically from the app update loop."""
-        app = App.get_running_app()
-        if state.is_healthy():
+        if state.healthy:
+            age_ds = int(state.heartbeat_age() * 10)
+            key = ("healthy", age_ds, state.flight_mode, state.armed)
+        elif state.last_heartbeat > 0:
+            age_ds = int(state.heartbeat_age() * 10)
+            key = ("stale", age_ds)
+        elif self.mav.running:
+            elapsed = self.mav.waiting_elapsed()
+            key = ("waiting", round(elapsed), self.mav.msg_count)
+        else:
+            key = ("idle",)
+        if key == self._last_status_key:
+            return
+
+        if key[0] == "healthy":
             self._set_status(
                 "Healthy", get_color("status_healthy"),
-                f"HB age: {state.heartbeat_age():.1f}s | "
+                f"HB age: {age_ds / 10:.1f}s | "
                 f"Mode: {state.flight_mode} | "
                 f"{'ARMED' if state.armed else 'DISARMED'}"
             )
-        elif state.last_heartbeat > 0:
+        elif key[0] == "stale":
             self._set_status(
                 "No Heartbeat", get_color("status_warn"),
-                f"Last heartbeat: {state.heartbeat_age():.1f}s ago"
+                f"Last heartbeat: {age_ds / 10:.1f}s ago"
             )
-        elif app.mav_client.running:
+        elif key[0] == "waiting":
             # Show diagnostic info while waiting for first message
-            elapsed = app.mav_client.waiting_elapsed()
-            msgs = app.mav_client.msg_count
-            detail = f"Waiting for heartbeat… ({elapsed:.0f}s, {msgs} msgs)"
+            detail = f"Waiting for heartbeat… ({key[1]}s, {key[2]} msgs)"
             if elapsed > 15:
                 detail += "  — No response. Try a different preset."
             self._set_status("Waiting…", get_color("status_error"), detail)
@@ -384,19 +473,81 @@ class ConnectionScreen(Screen):
                 "Not Connected", get_color("status_error"),
                 "Configure connection below"
             )
+        self._last_status_key = key
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Reusable telemetry tile widget
 # ═══════════════════════════════════════════════════════════════════════════
 
-def _tile_color(name):
-    return list(get_color(name))
+# list(get_color(name)) per colour name for the active theme.  Kivy
+# copies a list assigned to a ListProperty, so one cached list can be
+# shared by every tile; the cache is dropped when the theme changes.
+_tile_color_cache = {}
+_tile_color_theme = None
 
-GPS_FIX_NAMES = {
-    0: "NO GPS", 1: "NO FIX", 2: "2D FIX",
-    3: "3D FIX", 4: "DGPS", 5: "RTK FLT", 6: "RTK FIX",
-}
+
+def _tile_color(name):
+    global _tile_color_theme
+    theme = get_theme_name()
+    if theme != _tile_color_theme:
+        _tile_color_cache.clear()
+        _tile_color_theme = theme
+    color = _tile_color_cache.get(name)
+    if color is None:
+        color = _tile_color_cache[name] = list(get_color(name))
+    return color
+
+
+# Tiles without a threshold colour; they are restyled with the theme's
+# default tile colour whenever the theme changes.
+_DEFAULT_COLOR_TILES = (
+    "tile_mode", "tile_time", "tile_voltage", "tile_current",
+    "tile_alt_rel", "tile_alt_amsl", "tile_heading",
+    "tile_gndspd", "tile_vertspd", "tile_throttle",
+)
+
+# Tiles that show a single VehicleState attribute through a fixed
+# format: (tile id, %-format string, VehicleState attribute name).
+# Formatted in one loop over the state's __dict__ every tick.
+_TILE_FORMATS = (
+    ("tile_batt_pct", "%d%%", "battery_pct"),
+    ("tile_voltage", "%.1f V", "voltage"),
+    ("tile_alt_rel", "%.1f m", "alt_rel"),
+    ("tile_alt_amsl", "%.1f m", "alt_amsl"),
+    ("tile_heading", "%.0f\u00b0", "heading_deg"),
+    ("tile_gndspd", "%.1f m/s", "groundspeed"),
+    ("tile_sats", "%d", "satellites"),
+    ("tile_hdop", "%.1f", "hdop"),
+    ("tile_rssi", "%d%%", "rssi_percent"),
+    ("tile_throttle", "%d%%", "throttle"),
+)
+
+# Threshold-coloured tiles: (tile id, VehicleState attribute, ascending
+# thresholds, colour names).  bisect_right() over the thresholds picks
+# the colour index, so "value >= threshold" moves one step along the
+# ramp.  HDOP is better when lower, so its ramp runs the other way.
+_COLOR_RAMP = ("tile_red", "tile_yellow", "tile_green")
+_TILE_THRESHOLDS = (
+    ("tile_batt_pct", "battery_pct", (30, 50), _COLOR_RAMP),
+    ("tile_gps_fix", "fix_type", (2, 3), _COLOR_RAMP),
+    ("tile_sats", "satellites", (6, 10), _COLOR_RAMP),
+    ("tile_hdop", "hdop", (2.0, 3.0), _COLOR_RAMP[::-1]),
+    ("tile_rssi", "rssi_percent", (40, 70), _COLOR_RAMP),
+)
+
+# Indexed by MAVLink GPS_FIX_TYPE; see _fix_name() for out-of-range values
+GPS_FIX_NAMES = (
+    "NO GPS", "NO FIX", "2D FIX",
+    "3D FIX", "DGPS", "RTK FLT", "RTK FIX",
+    "STATIC", "PPP",
+)
+
+
+def _fix_name(fix_type):
+    if 0 <= fix_type < len(GPS_FIX_NAMES):
+        return GPS_FIX_NAMES[fix_type]
+    return f"TYPE {fix_type}"
 
 
 class TelemetryTile(BoxLayout):
@@ -412,7 +563,7 @@ class TelemetryTile(BoxLayout):
 # All items must be checked before the ARM button is enabled.
 # This forces the operator to manually verify each safety condition.
 
-CHECKLIST_ITEMS = [
+CHECKLIST_ITEMS = (
     "Good weather and air traffic",
     "Battery installation",
     "Confirm good health status of the CopterSonde",
@@ -420,14 +571,19 @@ CHECKLIST_ITEMS = [
     "CopterSonde is place on the launch pad",
     "Mission is generated",
     "Approval from crew for flights",
-]
+)
+
+
+def _wrap_to_width(label, _size):
+    """Size callback shared by checklist labels: wrap text to the width."""
+    label.text_size = (label.width, None)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Unified Flight Screen (telemetry + HUD + commands)
 # ═══════════════════════════════════════════════════════════════════════════
 
-class FlightScreen(Screen):
+class FlightScreen(_VisibleScreen):
     """Unified flight screen: telemetry table (left half), HUD (top-right),
     commands with pre-flight checklist (bottom-right)."""
 
@@ -443,12 +599,17 @@ class FlightScreen(Screen):
         7: "4fc3f7",   # DEBUG      - blue
     }
 
+    _STATUS_LOG_LINES = 30  # newest status messages shown in the log
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Pre-flight checklist gating — ARM button stays disabled until
         # all checklist items are checked and the user clicks Proceed.
         self._checklist_complete = False
+        # The checklist popup is built on first open and reused after that;
+        # it is rebuilt only when the theme has changed in between.
         self._checklist_popup = None
+        self._checklist_theme = None
         self._proceed_btn = None
         self._check_states = {}
         # Flight timer: starts on armed, stops on disarmed.
@@ -456,104 +617,123 @@ class FlightScreen(Screen):
         self._prev_armed = None
         self._flight_timer_start = None   # monotonic() timestamp when armed
         self._flight_timer_elapsed = 0.0  # accumulated seconds (survives pause)
-        # Status message caching — only rebuild the markup string when
-        # new messages arrive, not every UI tick.
-        self._cached_status_len = 0
-        self._cached_status_text = "No messages"
+        self._last_time_s = None  # whole seconds behind _last_time_str
+        self._last_time_str = "00:00:00"
+        # Raw value last formatted into each value tile, so unchanged
+        # readings skip both the format and the property set.
+        self._prev_values = {}
+        # Colour choice last applied per coloured tile, and the theme it
+        # was resolved against (see _update_telemetry).
+        self._prev_colors = {}
+        self._tile_theme = None
+        # Status message caching — formatted log lines (newest first) and
+        # the newest message they include; see update().
+        self._status_lines = deque(maxlen=self._STATUS_LOG_LINES)
+        self._cached_status_last = None
+
+    def on_kv_post(self, base_widget):
+        super().on_kv_post(base_widget)
+        # Cache app-level handles (see ConnectionScreen.on_kv_post)
+        self.app = App.get_running_app()
+        self.mav = self.app.mav_client
+        self.sim = self.app.sim
+        # Resolve the widgets touched every tick once, binding the tile
+        # tables to widget references so update() skips ids lookups.
+        ids = self.ids
+        self._default_tiles = tuple(ids[tid] for tid in _DEFAULT_COLOR_TILES)
+        self._format_tiles = tuple(
+            (ids[tid], fmt, key) for tid, fmt, key in _TILE_FORMATS)
+        self._threshold_tiles = tuple(
+            (ids[tid], key, thresholds, colors)
+            for tid, key, thresholds, colors in _TILE_THRESHOLDS)
+        self._tile_mode = ids.tile_mode
+        self._tile_armed = ids.tile_armed
+        self._tile_time = ids.tile_time
+        self._tile_current = ids.tile_current
+        self._tile_vertspd = ids.tile_vertspd
+        self._tile_gps_fix = ids.tile_gps_fix
+        self._armed_indicator = ids.armed_indicator
+        self._mode_display = ids.mode_display
+        self._status_log = ids.status_log
+        self._hud = ids.get('hud')
 
     # ── Telemetry update ──────────────────────────────────────────────
 
     def _update_telemetry(self, state):
-        if not state.is_healthy():
+        # A write is gated on its raw value only where the gate saves
+        # work: a %-format or f-string, or a colour list Kivy would copy
+        # before comparing.  Plain string assignments go straight through,
+        # since Kivy drops an equal value without dispatching.
+        if not state.healthy:
             return
 
-        # Set non-threshold tiles to theme default so they update on
-        # theme change (e.g. high-contrast needs a light background).
-        default = _tile_color("tile_default")
-        for tid in ("tile_mode", "tile_time", "tile_voltage", "tile_current",
-                     "tile_alt_rel", "tile_alt_amsl", "tile_heading",
-                     "tile_gndspd", "tile_vertspd", "tile_throttle"):
-            self.ids[tid].tile_color = default
+        # Tile colours only change with the underlying value or the
+        # theme.  On a theme switch, restyle the non-threshold tiles with
+        # the theme default (e.g. high-contrast needs a light background)
+        # and forget the cached colour choices so every tile repaints.
+        prev_colors = self._prev_colors
+        theme = get_theme_name()
+        if theme != self._tile_theme:
+            self._tile_theme = theme
+            prev_colors.clear()
+            default = _tile_color("tile_default")
+            for tile in self._default_tiles:
+                tile.tile_color = default
 
         # System
-        self.ids.tile_mode.value_text = state.flight_mode
-        self.ids.tile_armed.value_text = "ARMED" if state.armed else "DISARMED"
-        self.ids.tile_armed.tile_color = (
-            _tile_color("tile_green") if state.armed else _tile_color("tile_red")
-        )
+        prev = self._prev_values
+        self._tile_mode.value_text = state.flight_mode
+        armed = state.armed
+        if prev_colors.get("armed") != armed:
+            prev_colors["armed"] = armed
+            self._tile_armed.value_text = "ARMED" if armed else "DISARMED"
+            self._tile_armed.tile_color = _tile_color(
+                "tile_green" if armed else "tile_red")
 
         elapsed = self._flight_timer_elapsed
         if self._flight_timer_start is not None:
             elapsed += time.monotonic() - self._flight_timer_start
+        # The display only changes once a second, so skip the other ticks.
         t = int(elapsed)
-        m, s = divmod(t, 60)
-        h, m = divmod(m, 60)
-        self.ids.tile_time.value_text = f"{h:02d}:{m:02d}:{s:02d}"
-
-        # Battery
-        self.ids.tile_batt_pct.value_text = f"{state.battery_pct}%"
-        if state.battery_pct >= 50:
-            self.ids.tile_batt_pct.tile_color = _tile_color("tile_green")
-        elif state.battery_pct >= 30:
-            self.ids.tile_batt_pct.tile_color = _tile_color("tile_yellow")
-        else:
-            self.ids.tile_batt_pct.tile_color = _tile_color("tile_red")
-
-        self.ids.tile_voltage.value_text = f"{state.voltage:.1f} V"
-        self.ids.tile_current.value_text = f"{state.current / 1000:.1f} A"
-
-        # Navigation
-        self.ids.tile_alt_rel.value_text = f"{state.alt_rel:.1f} m"
-        self.ids.tile_alt_amsl.value_text = f"{state.alt_amsl:.1f} m"
-        self.ids.tile_heading.value_text = f"{state.heading_deg:.0f}\u00b0"
+        if t != self._last_time_s:
+            m, s = divmod(t, 60)
+            h, m = divmod(m, 60)
+            self._last_time_s = t
+            self._last_time_str = f"{h:02d}:{m:02d}:{s:02d}"
+            self._tile_time.value_text = self._last_time_str
+
+        # Plain formatted values (see _TILE_FORMATS)
+        values = vars(state)
+        for tile, fmt, key in self._format_tiles:
+            v = values[key]
+            if prev.get(key) != v:
+                prev[key] = v
+                tile.value_text = fmt % v
+
+        # Battery, GPS and radio colours (see _TILE_THRESHOLDS)
+        for tile, key, thresholds, colors in self._threshold_tiles:
+            i = bisect_right(thresholds, values[key])
+            if prev_colors.get(key) != i:
+                prev_colors[key] = i
+                tile.tile_color = _tile_color(colors[i])
+
+        if prev.get("current") != state.current:
+            prev["current"] = state.current
+            self._tile_current.value_text = f"{state.current / 1000:.1f} A"
 
         # Speed
-        self.ids.tile_gndspd.value_text = f"{state.groundspeed:.1f} m/s"
-        vz_ms = state.vz / 100.0
-        self.ids.tile_vertspd.value_text = f"{vz_ms:.1f} m/s"
+        if prev.get("vz") != state.vz:
+            prev["vz"] = state.vz
+            self._tile_vertspd.value_text = f"{state.vz / 100.0:.1f} m/s"
 
         # GPS
-        fix_name = GPS_FIX_NAMES.get(state.fix_type, f"TYPE {state.fix_type}")
-        self.ids.tile_gps_fix.value_text = fix_name
-        if state.fix_type >= 3:
-            self.ids.tile_gps_fix.tile_color = _tile_color("tile_green")
-        elif state.fix_type >= 2:
-            self.ids.tile_gps_fix.tile_color = _tile_color("tile_yellow")
-        else:
-            self.ids.tile_gps_fix.tile_color = _tile_color("tile_red")
-
-        self.ids.tile_sats.value_text = str(state.satellites)
-        if state.satellites >= 10:
-            self.ids.tile_sats.tile_color = _tile_color("tile_green")
-        elif state.satellites >= 6:
-            self.ids.tile_sats.tile_color = _tile_color("tile_yellow")
-        else:
-            self.ids.tile_sats.tile_color = _tile_color("tile_red")
-
-        self.ids.tile_hdop.value_text = f"{state.hdop:.1f}"
-        if state.hdop < 2.0:
-            self.ids.tile_hdop.tile_color = _tile_color("tile_green")
-        elif state.hdop < 3.0:
-            self.ids.tile_hdop.tile_color = _tile_color("tile_yellow")
-        else:
-            self.ids.tile_hdop.tile_color = _tile_color("tile_red")
-
-        # Radio & Throttle
-        self.ids.tile_rssi.value_text = f"{state.rssi_percent}%"
-        if state.rssi_percent >= 70:
-            self.ids.tile_rssi.tile_color = _tile_color("tile_green")
-        elif state.rssi_percent >= 40:
-            self.ids.tile_rssi.tile_color = _tile_color("tile_yellow")
-        else:
-            self.ids.tile_rssi.tile_color = _tile_color("tile_red")
-
-        self.ids.tile_throttle.value_text = f"{state.throttle}%"
+        self._tile_gps_fix.value_text = _fix_name(state.fix_type)
 
     # ── HUD update ────────────────────────────────────────────────────
 
     def _update_hud(self, state):
-        hud = self.ids.get('hud')
-        if hud and state.is_healthy():
+        hud = self._hud
+        if hud and state.healthy:
             hud.set_state(
                 roll=state.roll,
                 pitch=state.pitch,
@@ -581,14 +761,13 @@ class FlightScreen(Screen):
                       lambda: self._do_generate_mission(alt))
 
     def _do_generate_mission(self, alt):
-        app = App.get_running_app()
         self.ids.cmd_feedback.text = f"Generating mission ({alt:.0f} m)\u2026"
 
         def _on_done(success, message):
             Clock.schedule_once(
                 lambda _dt: setattr(self.ids.cmd_feedback, 'text', message), 0)
 
-        app.mav_client.trigger_autovp(alt, on_done=_on_done)
+        self.mav.trigger_autovp(alt, on_done=_on_done)
 
     # ── Command: arm & takeoff ────────────────────────────────────────
 
@@ -602,14 +781,13 @@ class FlightScreen(Screen):
                       self._do_arm_takeoff)
 
     def _do_arm_takeoff(self):
-        app = App.get_running_app()
         self.ids.cmd_feedback.text = "Arming: LOITER \u2192 ARM \u2192 AUTO\u2026"
 
         def _on_done(success, message):
             Clock.schedule_once(
                 lambda _dt: setattr(self.ids.cmd_feedback, 'text', message), 0)
 
-        app.mav_client.arm_and_takeoff_auto(on_done=_on_done)
+        self.mav.arm_and_takeoff_auto(on_done=_on_done)
 
     # ── Command: loiter (replaces LAND) ───────────────────────────────
 
@@ -624,16 +802,17 @@ class FlightScreen(Screen):
                       lambda: self._do_set_mode("RTL"))
 
     def _do_set_mode(self, mode):
-        App.get_running_app().mav_client.set_mode(mode)
+        def _on_done(error):
+            # Runs on the Kivy thread once the IO thread has sent it
+            if error is not None:
+                self.ids.cmd_feedback.text = f"Mode {mode} failed: {error}"
+
+        self.mav.set_mode(mode, on_done=_on_done)
         self.ids.cmd_feedback.text = f"Mode {mode} command sent"
 
     # ── Confirmation popup ────────────────────────────────────────────
 
     def _confirm(self, title, message, on_yes):
-        from kivy.uix.popup import Popup
-        from kivy.uix.label import Label
-        from kivy.uix.button import Button
-
         content = BoxLayout(orientation='vertical', padding=10, spacing=10)
         content.add_widget(Label(
             text=message, font_size='14sp', color=get_color("text_label")))
@@ -656,19 +835,24 @@ class FlightScreen(Screen):
     # ── Pre-flight checklist popup ────────────────────────────────────
 
     def on_checklist(self):
-        app = App.get_running_app()
-        if app.vehicle_state.armed:
+        if self.app.vehicle_state.armed:
             self.ids.cmd_feedback.text = "Cannot open checklist while armed"
             return
         self._show_checklist_popup()
 
     def _show_checklist_popup(self):
-        from kivy.uix.popup import Popup
-        from kivy.uix.label import Label
-        from kivy.uix.button import Button
-        from kivy.uix.checkbox import CheckBox
-        from kivy.uix.scrollview import ScrollView
+        theme = get_theme_name()
+        if self._checklist_popup is None or self._checklist_theme != theme:
+            self._build_checklist_popup()
+            self._checklist_theme = theme
+        else:
+            # Reopening: start again with every item unchecked
+            for cb in self._check_states.values():
+                cb.active = False
+            self._proceed_btn.disabled = True
+        self._checklist_popup.open()
 
+    def _build_checklist_popup(self):
         content = BoxLayout(orientation='vertical', padding=10, spacing=8)
 
         content.add_widget(Label(
@@ -690,10 +874,9 @@ class FlightScreen(Screen):
                 text=item_text, font_size='12sp',
                 color=get_color("text_primary"),
                 halign='left', valign='middle')
-            lbl.bind(size=lambda inst, val: setattr(
-                inst, 'text_size', (inst.width, None)))
+            lbl.fbind('size', _wrap_to_width)
             self._check_states[i] = cb
-            cb.bind(active=lambda inst, val: self._update_proceed_btn())
+            cb.fbind('active', self._on_check_active)
             row.add_widget(cb)
             row.add_widget(lbl)
             checklist_box.add_widget(row)
@@ -716,17 +899,17 @@ class FlightScreen(Screen):
             title='Pre-Flight Checklist', content=content,
             size_hint=(0.7, 0.8), auto_dismiss=False)
 
-        proceed_btn.bind(
-            on_release=lambda *_: self._on_checklist_proceed(popup))
-        cancel_btn.bind(
-            on_release=lambda *_: self._on_checklist_cancel(popup))
+        proceed_btn.fbind('on_release', self._on_checklist_proceed)
+        cancel_btn.fbind('on_release', self._on_checklist_cancel)
 
         btn_row.add_widget(proceed_btn)
         btn_row.add_widget(cancel_btn)
         content.add_widget(btn_row)
 
         self._checklist_popup = popup
-        popup.open()
+
+    def _on_check_active(self, _cb, _active):
+        self._update_proceed_btn()
 
     def _update_proceed_btn(self):
         if self._proceed_btn:
@@ -734,18 +917,14 @@ class FlightScreen(Screen):
                 cb.active for cb in self._check_states.values())
             self._proceed_btn.disabled = not all_checked
 
-    def _on_checklist_proceed(self, popup):
+    def _on_checklist_proceed(self, *_):
         self._checklist_complete = True
         self.ids.arm_btn.disabled = False
-        popup.dismiss()
-        self._checklist_popup = None
-        self._proceed_btn = None
+        self._checklist_popup.dismiss()
         self.ids.cmd_feedback.text = "Checklist complete \u2014 ARM & TAKEOFF enabled"
 
-    def _on_checklist_cancel(self, popup):
-        popup.dismiss()
-        self._checklist_popup = None
-        self._proceed_btn = None
+    def _on_checklist_cancel(self, *_):
+        self._checklist_popup.dismiss()
 
     # ── Armed state transition management ────────────────────────────
     # Detects DISARMED->ARMED and ARMED->DISARMED transitions to:
@@ -767,8 +946,6 @@ class FlightScreen(Screen):
             self.ids.arm_btn.disabled = True
             if self._checklist_popup:
                 self._checklist_popup.dismiss()
-                self._checklist_popup = None
-                self._proceed_btn = None
         else:
             # ARMED -> DISARMED: accumulate flight time and stop timer
             if self._flight_timer_start is not None:
@@ -782,48 +959,74 @@ class FlightScreen(Screen):
 
         self._prev_armed = armed
 
+    def _format_status_line(self, sm):
+        """Kivy markup for one status log line."""
+        hex_col = self._SEV_COLORS.get(sm.severity, "4fc3f7")
+        # Escape Kivy markup special chars to prevent rendering errors
+        safe_text = sm.text.replace("&", "&amp;").replace(
+            "[", "&bl;").replace("]", "&br;")
+        return (f"[color={hex_col}]&bl;{sm.time_str}&br; "
+                f"&bl;{sm.severity_name}&br; {safe_text}[/color]")
+
     # ── Main update ───────────────────────────────────────────────────
 
     def update(self, state):
+        if not self._visible:
+            return
+
         # Armed state drives button enable/disable
         self._update_armed_state(state)
 
-        # Armed indicator and mode display (always update)
-        if state.armed:
-            self.ids.armed_indicator.text = "ARMED"
-            self.ids.armed_indicator.color = get_color("armed_color")
-        else:
-            self.ids.armed_indicator.text = "DISARMED"
-            self.ids.armed_indicator.color = get_color("disarmed_color")
-        self.ids.mode_display.text = f"Mode: {state.flight_mode}"
-
-        # Status message caching: only rebuild the Kivy markup string
-        # when new messages arrive (cheap len() check vs expensive string ops).
-        msg_count = len(state.status_messages)
-        if msg_count != self._cached_status_len:
-            self._cached_status_len = msg_count
-            msgs = state.status_messages[-30:]  # show last 30 messages
-            lines = []
-            for sm in reversed(msgs):  # newest first
-                ts = datetime.datetime.fromtimestamp(sm.timestamp).strftime(
-                    "%H:%M:%S")
-                hex_col = self._SEV_COLORS.get(sm.severity, "4fc3f7")
-                # Escape Kivy markup special chars to prevent rendering errors
-                safe_text = sm.text.replace("&", "&amp;").replace(
-                    "[", "&bl;").replace("]", "&br;")
-                lines.append(
-                    f"[color={hex_col}]&bl;{ts}&br; "
-                    f"&bl;{sm.severity_name}&br; {safe_text}[/color]"
-                )
-            self._cached_status_text = "\n".join(lines) if lines else "No messages"
-        self.ids.status_log.text = self._cached_status_text
+        # Armed indicator and mode display — restyled only when the armed
+        # state or the theme changes; colours come from the tile cache.
+        armed_key = (state.armed, get_theme_name())
+        if self._prev_values.get("armed_indicator") != armed_key:
+            self._prev_values["armed_indicator"] = armed_key
+            if state.armed:
+                self._armed_indicator.text = "ARMED"
+                self._armed_indicator.color = _tile_color("armed_color")
+            else:
+                self._armed_indicator.text = "DISARMED"
+                self._armed_indicator.color = _tile_color("disarmed_color")
+        if self._prev_values.get("mode_display") != state.flight_mode:
+            self._prev_values["mode_display"] = state.flight_mode
+            self._mode_display.text = f"Mode: {state.flight_mode}"
+
+        # Status message caching: only touch the log when a new message
+        # has arrived, and then format just the new messages.  Identity of
+        # the newest message is the change test — the deque length stops
+        # changing once it hits its 200-message cap.  The IO thread keeps
+        # appending while this runs, so everything rendered and cached
+        # below comes from one copy of the deque.
+        msgs = state.status_messages
+        if (msgs[-1] if msgs else None) is not self._cached_status_last:
+            prev = self._cached_status_last
+            # Newest first; list() copies in one C call, so the IO thread
+            # appending meanwhile can't invalidate the iterator.  The
+            # newest message shown is taken from this same copy, not from
+            # the msgs[-1] read above, which an append may already have
+            # overtaken.
+            new = list(islice(reversed(msgs), self._STATUS_LOG_LINES))
+            last = new[0] if new else None
+            for i, sm in enumerate(new):
+                if sm is prev:
+                    del new[i:]
+                    break
+            else:
+                # Last shown message scrolled out (or log was reset)
+                self._status_lines.clear()
+            for sm in reversed(new):  # appendleft keeps newest on top
+                self._status_lines.appendleft(self._format_status_line(sm))
+            self._cached_status_last = last
+            self._status_log.text = ("\n".join(self._status_lines)
+                                     if self._status_lines else "No messages")
 
         # Telemetry and HUD
         self._update_telemetry(state)
         self._update_hud(state)
 
 
-class SensorPlotScreen(Screen):
+class SensorPlotScreen(_VisibleScreen):
     """CASS sensor time-series: T1/T2/T3 and RH1/RH2/RH3 vs time."""
 
     _TEMP_COLORS = [
@@ -843,9 +1046,21 @@ class SensorPlotScreen(Screen):
         self._snap_time = None
         self._snap_temp = None
         self._snap_rh = None
+        # (sample count, newest timestamp) of the last plotted history;
+        # update() skips the rebuild + redraw when it hasn't moved.
+        self._last_sig = None
+        self._reset_series()
 
     _PLOT_WINDOW = 30  # seconds of data to keep for plotting
 
+    def _reset_series(self):
+        """Drop the incrementally built series so the next update()
+        rebuilds them from the current history window."""
+        self._series_src = None   # h_time deque the series were built from
+        self._series_seen = 0     # state.h_count already converted
+        self._temp_pts = [deque() for _ in range(3)]
+        self._rh_pts = [deque() for _ in range(3)]
+
     def toggle_pause(self):
         self._paused = not self._paused
         btn = self.ids.get('pause_btn')
@@ -853,6 +1068,10 @@ class SensorPlotScreen(Screen):
             btn.text = 'Resume' if self._paused else 'Pause'
 
     def clear_plots(self):
+        # Forget the plotted signature too, so the next tick repaints the
+        # window even if no new sample has arrived.
+        self._reset_series()
+        self._last_sig = None
         for pid in ('temp_plot', 'rh_plot'):
             p = self.ids.get(pid)
             if p:
@@ -863,81 +1082,115 @@ class SensorPlotScreen(Screen):
         s = app.vehicle_state
         if not s.h_time:
             return
-        import csv
-        import os
         if ON_ANDROID:
             base = os.path.join(_android_storage_base(), "exports")
         else:
             base = os.path.join(_REPO_ROOT, "exports")
         os.makedirs(base, exist_ok=True)
-        import datetime
         ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         path = os.path.join(base, f"sensors_{ts}.csv")
-        with open(path, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["time_s", "T1", "T2", "T3", "RH1", "RH2", "RH3"])
-            for i, t in enumerate(s.h_time):
-                temps = s.h_temp_sensors[i] if i < len(s.h_temp_sensors) else []
-                rhs = s.h_rh_sensors[i] if i < len(s.h_rh_sensors) else []
-                row = [f"{t:.2f}"]
-                row += [f"{v:.2f}" for v in temps] + [""] * (3 - len(temps))
-                row += [f"{v:.2f}" for v in rhs] + [""] * (3 - len(rhs))
-                writer.writerow(row)
-        fb = self.ids.get('export_feedback')
-        if fb:
-            fb.text = f"Saved: {os.path.basename(path)}"
+        # Snapshot the histories here: list() copies a deque in a single C
+        # call, so the IO thread can't append mid-copy.  Formatting and
+        # the write then run on a worker so long exports don't stall the
+        # UI; the result is posted back to the label via the Clock.
+        threading.Thread(
+            target=self._write_csv,
+            args=(path, list(s.h_time), list(s.h_temp_sensors),
+                  list(s.h_rh_sensors)),
+            name="csv-export", daemon=True,
+        ).start()
+
+    def _write_csv(self, path, times, temps, rhs):
+        """Format and write a sensor export (runs on a worker thread)."""
+        # Format every row up front and write the file in one call.  All
+        # fields are plain numbers, so no CSV quoting is needed; rows use
+        # "\r\n" like csv.writer's default dialect.  Missing sensor
+        # samples become empty cells.
+        lines = ["time_s,T1,T2,T3,RH1,RH2,RH3"]
+        for t, (ts, rs) in zip(times, zip_longest(temps, rhs, fillvalue=())):
+            row = [f"{t:.2f}"]
+            row += [f"{v:.2f}" for v in ts] + [""] * (3 - len(ts))
+            row += [f"{v:.2f}" for v in rs] + [""] * (3 - len(rs))
+            lines.append(",".join(row))
+        lines.append("")
+        try:
+            with open(path, "w", newline="") as f:
+                f.write("\r\n".join(lines))
+            msg = f"Saved: {os.path.basename(path)}"
+        except OSError as exc:
+            log.error("CSV export failed: %s", exc)
+            msg = "Export failed"
+
+        def _show(_dt):
+            fb = self.ids.get('export_feedback')
+            if fb:
+                fb.text = msg
+        Clock.schedule_once(_show, 0)
 
     def update(self, state):
-        if self._paused:
+        if not self._visible or self._paused:
             return
         if not state.h_time:
             return
+        sig = (len(state.h_time), state.h_time[-1])
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
+
+        # ── Incremental series ───────────────────────────────────────
+        # Only samples appended since the last update (state.h_count) are
+        # converted; the kept series are trimmed to the window below.
+        # clear_history() swaps in new deques, which forces a rebuild.
+        # The lengths, h_count and the new samples are read under
+        # history_lock so an append on the IO thread can't land between
+        # them and shift the slice by one.
+        with state.history_lock:
+            h_time = state.h_time
+            n = len(h_time)
+            count = state.h_count
+            if h_time is not self._series_src or count < self._series_seen:
+                self._reset_series()
+                self._series_src = h_time
+            new = min(count - self._series_seen, n)
+            self._series_seen = count
+
+            # ── Rolling time window ──────────────────────────────────
+            # Only plot the last _PLOT_WINDOW seconds.
+            t_cutoff = h_time[-1] - self._PLOT_WINDOW
+            start = n - new
+            if start == 0:
+                # Rebuilding: history deques can grow large during long
+                # flights, so binary-search the window start in O(log n)
+                # instead of converting samples that would be trimmed.
+                # bisect accepts any sequence, deques included; timestamps
+                # are appended in order so h_time is sorted.
+                start = bisect_left(h_time, t_cutoff)
+
+            # Materialize the new samples once; indexing a deque by
+            # position is O(n) from the far end, so slice with islice and
+            # zip instead.  zip() stops at the shortest list, matching the
+            # old bounds checks.
+            times = list(islice(h_time, start, n))
+            temps = list(islice(state.h_temp_sensors, start, n))
+            rhs = list(islice(state.h_rh_sensors, start, n))
 
-        # ── Rolling time window ──────────────────────────────────────
-        # Only plot the last _PLOT_WINDOW seconds.  History deques can
-        # grow large during long flights, so we use binary search to
-        # find the start index in O(log n) instead of scanning O(n).
-        t_latest = state.h_time[-1]
-        t_cutoff = t_latest - self._PLOT_WINDOW
-
-        # Manual bisect_left on the deque (bisect module requires list)
-        h_time = state.h_time
-        n = len(h_time)
-        lo, hi = 0, n
-        while lo < hi:
-            mid = (lo + hi) // 2
-            if h_time[mid] < t_cutoff:
-                lo = mid + 1
-            else:
-                hi = mid
-        start = lo  # first index within the time window
-
-        # Build temperature series from windowed history
-        temp_series = {}
-        for idx in range(3):
-            name = f"T{idx + 1}"
-            color = self._TEMP_COLORS[idx]
-            pts = []
-            for i in range(start, n):
-                t = h_time[i]
-                sensors = state.h_temp_sensors[i] if i < len(state.h_temp_sensors) else []
-                if idx < len(sensors):
-                    # Convert from Kelvin (MAVLink) to Celsius for display
-                    pts.append((t, sensors[idx] - 273.15))
-            temp_series[name] = (color, pts)
-
-        # Build RH series (already in percent, no conversion needed)
-        rh_series = {}
         for idx in range(3):
-            name = f"RH{idx + 1}"
-            color = self._RH_COLORS[idx]
-            pts = []
-            for i in range(start, n):
-                t = h_time[i]
-                sensors = state.h_rh_sensors[i] if i < len(state.h_rh_sensors) else []
-                if idx < len(sensors):
-                    pts.append((t, sensors[idx]))
-            rh_series[name] = (color, pts)
+            # Convert from Kelvin (MAVLink) to Celsius for display
+            self._temp_pts[idx].extend(
+                (t, s[idx] - 273.15)
+                for t, s in zip(times, temps) if idx < len(s))
+            # RH is already in percent, no conversion needed
+            self._rh_pts[idx].extend(
+                (t, s[idx]) for t, s in zip(times, rhs) if idx < len(s))
+
+        for pts in self._temp_pts + self._rh_pts:
+            while pts and pts[0][0] < t_cutoff:
+                pts.popleft()
+
+        temp_series = {f"T{idx + 1}": (self._TEMP_COLORS[idx], pts)
+                       for idx, pts in enumerate(self._temp_pts)}
+        rh_series = {f"RH{idx + 1}": (self._RH_COLORS[idx], pts)
+                     for idx, pts in enumerate(self._rh_pts)}
 
         temp_plot = self.ids.get('temp_plot')
         rh_plot = self.ids.get('rh_plot')
@@ -947,9 +1200,15 @@ class SensorPlotScreen(Screen):
             rh_plot.set_data(rh_series)
 
 
-class ProfileScreen(Screen):
+class ProfileScreen(_VisibleScreen):
     """Temperature, dew point, and wind profiles vs altitude."""
 
+    _last_sig = None  # history signature of the last plotted profile
+    # Incrementally built profile points (see update()); the deques are
+    # created on first use, sized to the vehicle's MAX_HISTORY.
+    _profile_src = None   # h_alt_rel deque the points were built from
+    _profile_seen = 0     # state.h_count already converted
+
     def clear_profile(self):
         app = App.get_running_app()
         app.vehicle_state.clear_history()
@@ -959,18 +1218,40 @@ class ProfileScreen(Screen):
                 p.set_data({})
 
     def update(self, state):
-        if not state.h_time:
+        if not self._visible or not state.h_time:
             return
-
-        import math
+        sig = (len(state.h_time), state.h_time[-1])
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
+
+        # Only samples appended since the last update are converted.  The
+        # point deques share the history's maxlen, so they evict their
+        # oldest points in step with it.  clear_history() swaps in new
+        # deques, which forces a rebuild.  history_lock keeps the count
+        # and the sliced samples consistent (see SensorPlotScreen.update).
+        with state.history_lock:
+            h_alt = state.h_alt_rel
+            n = len(h_alt)
+            count = state.h_count
+            if h_alt is not self._profile_src or count < self._profile_seen:
+                self._temp_pts = deque(maxlen=state.MAX_HISTORY)
+                self._dew_pts = deque(maxlen=state.MAX_HISTORY)
+                self._wspd_pts = deque(maxlen=state.MAX_HISTORY)
+                self._profile_src = h_alt
+                self._profile_seen = 0
+            new = min(count - self._profile_seen, n)
+            self._profile_seen = count
+            start = n - new
+            alts = list(islice(h_alt, start, n))
+            temps = list(islice(state.h_temperature, start, n))
+            dews = list(islice(state.h_dew_temp, start, n))
+            wspds = list(islice(state.h_wind_speed, start, n))
 
         # Temperature & Dew Point vs Altitude
-        temp_pts, dew_pts = [], []
-        for i, alt in enumerate(state.h_alt_rel):
-            if i < len(state.h_temperature):
-                temp_pts.append((state.h_temperature[i], alt))
-            if i < len(state.h_dew_temp):
-                dew_pts.append((state.h_dew_temp[i], alt))
+        temp_pts, dew_pts = self._temp_pts, self._dew_pts
+        temp_pts.extend(zip(temps, alts))
+        dew_pts.extend(zip(dews, alts))
 
         temp_profile = self.ids.get('temp_profile')
         if temp_profile:
@@ -980,10 +1261,8 @@ class ProfileScreen(Screen):
             })
 
         # Wind Speed vs Altitude
-        wspd_pts = []
-        for i, alt in enumerate(state.h_alt_rel):
-            if i < len(state.h_wind_speed):
-                wspd_pts.append((state.h_wind_speed[i], alt))
+        wspd_pts = self._wspd_pts
+        wspd_pts.extend(zip(wspds, alts))
 
         wind_profile = self.ids.get('wind_profile')
         if wind_profile:
@@ -992,9 +1271,17 @@ class ProfileScreen(Screen):
             })
 
 
-class MapScreen(Screen):
+class MapScreen(_VisibleScreen):
     """Satellite map with drone position, track, and ADS-B targets."""
 
+    _last_sig = None  # position/history/ADS-B signature of the last redraw
+    # Track polyline kept between updates and extended with new samples
+    # only (same scheme as ProfileScreen); MapWidget downsamples it.
+    _track_src = None   # h_lat deque the track was built from
+    _track_seen = 0     # state.h_count already converted
+    _adsb = ()            # (callsign, lat, lon, alt, heading) per target
+    _adsb_version = None  # state.adsb_version _adsb was built from
+
     def on_toggle_track(self):
         """Toggle track visibility and update button color."""
         m = self.ids.get('map_view')
@@ -1020,20 +1307,53 @@ class MapScreen(Screen):
                     else app.theme_btn_toggle_off)
 
     def update(self, state):
+        if not self._visible:
+            return
         m = self.ids.get('map_view')
         if not m:
             return
-        if not state.is_healthy():
+        if not state.healthy:
             return
 
-        # Build track from history
-        track = list(zip(state.h_lat, state.h_lon))
-
-        # Build ADS-B target list
-        adsb = []
-        for tgt in state.adsb_targets.values():
-            adsb.append((tgt.callsign, tgt.lat, tgt.lon,
-                         tgt.alt_m, tgt.heading))
+        # Rebuild the ADS-B target list only when a target was added or
+        # moved.  The version is read before copying, so a change that
+        # lands mid-copy just triggers another rebuild next tick.
+        adsb_version = state.adsb_version
+        if adsb_version != self._adsb_version:
+            self._adsb_version = adsb_version
+            self._adsb = [(tgt.callsign, tgt.lat, tgt.lon,
+                           tgt.alt_m, tgt.heading)
+                          for tgt in list(state.adsb_targets.values())]
+        adsb = self._adsb
+
+        # Skip the track rebuild and map redraw when neither the drone,
+        # its history nor any ADS-B target has moved since last time.
+        h_time = state.h_time
+        sig = (len(h_time), h_time[-1] if h_time else 0,
+               state.lat, state.lon, state.heading_deg, adsb_version)
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
+
+        # Extend the track with samples appended since the last update,
+        # dropping points the history itself has evicted.  history_lock
+        # keeps the count and the sliced samples consistent (see
+        # SensorPlotScreen.update).
+        with state.history_lock:
+            h_lat = state.h_lat
+            n = len(h_lat)
+            count = state.h_count
+            if h_lat is not self._track_src or count < self._track_seen:
+                self._track = []
+                self._track_src = h_lat
+                self._track_seen = 0
+            new = min(count - self._track_seen, n)
+            self._track_seen = count
+            track = self._track
+            track.extend(zip(list(islice(h_lat, n - new, n)),
+                             list(islice(state.h_lon, n - new, n))))
+        if len(track) > state.MAX_HISTORY:
+            del track[:len(track) - state.MAX_HISTORY]
 
         m.set_state(
             lat=state.lat, lon=state.lon,
@@ -1069,8 +1389,8 @@ DEFAULT_STREAM_RATE_HZ = 10
 class SettingsScreen(Screen):
     """Alert thresholds, wind coefficients, and app settings with JSON persistence.
 
-    All settings are persisted immediately on change via _save_settings()
-    so they survive app restarts.
+    Changes are marked dirty on the app and written shortly afterwards
+    (see CopterSondeGCSApp.mark_settings_dirty) so they survive restarts.
     """
 
     # Maps between UI display names and internal theme identifiers
@@ -1079,7 +1399,7 @@ class SettingsScreen(Screen):
 
     # Mapping: (settings_data key, KV widget id) for threshold inputs.
     # Used to generically load/save all threshold fields in loops.
-    _FIELDS = [
+    _FIELDS = (
         ("battery_pct_warn", "th_batt_warn"),
         ("battery_pct_crit", "th_batt_crit"),
         ("voltage_min",      "th_volt_min"),
@@ -1091,36 +1411,68 @@ class SettingsScreen(Screen):
         ("temp_max_c",       "th_temp_max"),
         ("rh_min",           "th_rh_min"),
         ("rh_max",           "th_rh_max"),
-    ]
+    )
 
-    _WIND_FIELDS = [
+    _WIND_FIELDS = (
         ("ws_a", "wind_ws_a"),
         ("ws_b", "wind_ws_b"),
-    ]
+    )
+
+    def on_kv_post(self, base_widget):
+        super().on_kv_post(base_widget)
+        # Resolve widget ids once; the field loops below walk these
+        # (settings key, TextInput) pairs instead of looking up self.ids.
+        ids = self.ids
+        self._field_inputs = [(key, ids[wid]) for key, wid in self._FIELDS
+                              if wid in ids]
+        self._wind_inputs = [(key, ids[wid]) for key, wid in self._WIND_FIELDS
+                             if wid in ids]
+        self._theme_spinner = ids.get("theme_spinner")
+        self._stream_rate_input = ids.get("stream_rate_input")
+        self._settings_fb = ids.get("settings_feedback")
+        self._wind_fb = ids.get("wind_feedback")
+        self._theme_fb = ids.get("theme_feedback")
+        self._stream_rate_fb = ids.get("stream_rate_feedback")
+        # settings key -> (text, value) last shown in or read from its input
+        self._shown = {}
+
+    def _show_value(self, key, inp, value):
+        """Put a setting into its input and remember what was shown."""
+        text = str(value)
+        inp.text = text
+        self._shown[key] = (text, value)
+
+    def _read_value(self, key, inp, default):
+        """Parse an input; text the user didn't touch reuses its value."""
+        text = inp.text
+        shown = self._shown.get(key)
+        if shown is not None and shown[0] == text:
+            return shown[1]
+        try:
+            value = float(text)
+        except ValueError:
+            value = default
+        self._shown[key] = (text, value)
+        return value
 
     def on_enter(self):
         app = App.get_running_app()
         # Thresholds tab
         thresholds = app.settings_data.get("thresholds", {})
-        for key, widget_id in self._FIELDS:
-            val = thresholds.get(key, DEFAULT_THRESHOLDS[key])
-            inp = self.ids.get(widget_id)
-            if inp:
-                inp.text = str(val)
+        for key, inp in self._field_inputs:
+            self._show_value(key, inp,
+                             thresholds.get(key, DEFAULT_THRESHOLDS[key]))
         # Wind coefficients tab
         wind = app.settings_data.get("wind_coeffs", {})
-        for key, widget_id in self._WIND_FIELDS:
-            val = wind.get(key, DEFAULT_WIND_COEFFS[key])
-            inp = self.ids.get(widget_id)
-            if inp:
-                inp.text = str(val)
+        for key, inp in self._wind_inputs:
+            self._show_value(key, inp, wind.get(key, DEFAULT_WIND_COEFFS[key]))
         # Theme spinner
-        spinner = self.ids.get("theme_spinner")
+        spinner = self._theme_spinner
         if spinner:
             current = get_theme_name()
             spinner.text = self._THEME_DISPLAY.get(current, "Dark")
         # Stream rate
-        rate_inp = self.ids.get("stream_rate_input")
+        rate_inp = self._stream_rate_input
         if rate_inp:
             rate_inp.text = str(
                 app.settings_data.get("stream_rate_hz", DEFAULT_STREAM_RATE_HZ))
@@ -1130,28 +1482,22 @@ class SettingsScreen(Screen):
     def apply_thresholds(self):
         app = App.get_running_app()
         thresholds = {}
-        for key, widget_id in self._FIELDS:
-            inp = self.ids.get(widget_id)
-            if inp:
-                try:
-                    thresholds[key] = float(inp.text)
-                except ValueError:
-                    thresholds[key] = DEFAULT_THRESHOLDS[key]
+        for key, inp in self._field_inputs:
+            thresholds[key] = self._read_value(key, inp,
+                                               DEFAULT_THRESHOLDS[key])
         app.settings_data["thresholds"] = thresholds
-        _save_settings(app.settings_data)
-        fb = self.ids.get('settings_feedback')
+        app.mark_settings_dirty()
+        fb = self._settings_fb
         if fb:
             fb.text = "Thresholds saved"
 
     def reset_defaults(self):
         app = App.get_running_app()
         app.settings_data["thresholds"] = dict(DEFAULT_THRESHOLDS)
-        _save_settings(app.settings_data)
-        for key, widget_id in self._FIELDS:
-            inp = self.ids.get(widget_id)
-            if inp:
-                inp.text = str(DEFAULT_THRESHOLDS[key])
-        fb = self.ids.get('settings_feedback')
+        app.mark_settings_dirty()
+        for key, inp in self._field_inputs:
+            self._show_value(key, inp, DEFAULT_THRESHOLDS[key])
+        fb = self._settings_fb
         if fb:
             fb.text = "Reset to defaults"
 
@@ -1160,38 +1506,31 @@ class SettingsScreen(Screen):
     def apply_wind_coeffs(self):
         app = App.get_running_app()
         coeffs = {}
-        for key, widget_id in self._WIND_FIELDS:
-            inp = self.ids.get(widget_id)
-            if inp:
-                try:
-                    coeffs[key] = float(inp.text)
-                except ValueError:
-                    coeffs[key] = DEFAULT_WIND_COEFFS[key]
+        for key, inp in self._wind_inputs:
+            coeffs[key] = self._read_value(key, inp, DEFAULT_WIND_COEFFS[key])
         app.settings_data["wind_coeffs"] = coeffs
-        _save_settings(app.settings_data)
+        app.mark_settings_dirty()
         # Hot-reload: push new coefficients to running clients immediately
         # so the next wind calculation uses updated values without reconnect
         app.mav_client.ws_a = coeffs["ws_a"]
         app.mav_client.ws_b = coeffs["ws_b"]
         app.sim.ws_a = coeffs["ws_a"]
         app.sim.ws_b = coeffs["ws_b"]
-        fb = self.ids.get('wind_feedback')
+        fb = self._wind_fb
         if fb:
             fb.text = f"Saved: A={coeffs['ws_a']}, B={coeffs['ws_b']}"
 
     def reset_wind_defaults(self):
         app = App.get_running_app()
         app.settings_data["wind_coeffs"] = dict(DEFAULT_WIND_COEFFS)
-        _save_settings(app.settings_data)
-        for key, widget_id in self._WIND_FIELDS:
-            inp = self.ids.get(widget_id)
-            if inp:
-                inp.text = str(DEFAULT_WIND_COEFFS[key])
+        app.mark_settings_dirty()
+        for key, inp in self._wind_inputs:
+            self._show_value(key, inp, DEFAULT_WIND_COEFFS[key])
         app.mav_client.ws_a = DEFAULT_WIND_COEFFS["ws_a"]
         app.mav_client.ws_b = DEFAULT_WIND_COEFFS["ws_b"]
         app.sim.ws_a = DEFAULT_WIND_COEFFS["ws_a"]
         app.sim.ws_b = DEFAULT_WIND_COEFFS["ws_b"]
-        fb = self.ids.get('wind_feedback')
+        fb = self._wind_fb
         if fb:
             fb.text = "Reset to defaults"
 
@@ -1203,7 +1542,7 @@ class SettingsScreen(Screen):
             return
         app = App.get_running_app()
         app.set_app_theme(theme_name)
-        fb = self.ids.get("theme_feedback")
+        fb = self._theme_fb
         if fb:
             fb.text = f"Theme: {display_name}"
 
@@ -1216,13 +1555,15 @@ class SettingsScreen(Screen):
             rate = DEFAULT_STREAM_RATE_HZ
         rate = max(1, min(10, rate))
         app = App.get_running_app()
-        app.settings_data["stream_rate_hz"] = rate
-        _save_settings(app.settings_data)
+        # Called on Enter and again on focus loss; only a new value is saved
+        if app.settings_data.get("stream_rate_hz") != rate:
+            app.settings_data["stream_rate_hz"] = rate
+            app.mark_settings_dirty()
         # Update the input to show the clamped value
-        inp = self.ids.get("stream_rate_input")
+        inp = self._stream_rate_input
         if inp and inp.text != str(rate):
             inp.text = str(rate)
-        fb = self.ids.get("stream_rate_feedback")
+        fb = self._stream_rate_fb
         if fb:
             fb.text = f"Stream rate: {rate} Hz (takes effect on next connection)"
 
@@ -1445,11 +1786,6 @@ class ParamsScreen(Screen):
         self._confirm_write(app)
 
     def _confirm_write(self, app):
-        from kivy.uix.popup import Popup
-        from kivy.uix.label import Label
-        from kivy.uix.button import Button
-        from kivy.uix.scrollview import ScrollView
-
         count = len(self._modified)
         lines = []
         for name, val in sorted(self._modified.items()):
@@ -1620,96 +1956,134 @@ class CopterSondeGCSApp(App):
     title = "CopterSonde GCS"
 
     # ── Theme property system ─────────────────────────────────────────
-    # Each ListProperty below is bound to color attributes in the KV
+    # Each ColorProperty below is bound to color attributes in the KV
     # file via `app.theme_*`.  When apply_theme() updates these
     # properties, Kivy's property binding system automatically redraws
     # every widget that references them — no manual invalidation needed.
-    theme_bg_root = ListProperty([0.12, 0.12, 0.14, 1])
-    theme_bg_navbar = ListProperty([0.15, 0.15, 0.18, 1])
-    theme_bg_input = ListProperty([0.2, 0.2, 0.25, 1])
-    theme_bg_spinner = ListProperty([0.25, 0.25, 0.3, 1])
-    theme_bg_status_log = ListProperty([0.08, 0.08, 0.1, 1])
-    theme_text_primary = ListProperty([1, 1, 1, 1])
-    theme_text_title = ListProperty([0.8, 0.85, 0.9, 1])
-    theme_text_label = ListProperty([0.7, 0.7, 0.7, 1])
-    theme_text_settings = ListProperty([0.65, 0.65, 0.7, 1])
-    theme_text_tile_label = ListProperty([0.55, 0.6, 0.65, 1])
-    theme_text_section = ListProperty([0.45, 0.48, 0.52, 1])
-    theme_text_dim = ListProperty([0.4, 0.4, 0.4, 1])
-    theme_text_detail = ListProperty([0.6, 0.6, 0.6, 1])
-    theme_text_feedback = ListProperty([0.5, 0.7, 0.5, 1])
-    theme_text_cmd_feedback = ListProperty([0.5, 0.6, 0.7, 1])
-    theme_text_status_log = ListProperty([0.6, 0.7, 0.65, 1])
-    theme_text_mode_display = ListProperty([0.6, 0.65, 0.7, 1])
-
-    theme_text_last_update = ListProperty([0.5, 0.5, 0.5, 1])
-    theme_text_formula = ListProperty([0.5, 0.55, 0.6, 1])
-    theme_btn_connect = ListProperty([0.2, 0.55, 0.3, 1])
-    theme_btn_action = ListProperty([0.25, 0.35, 0.5, 1])
-    theme_btn_danger = ListProperty([0.7, 0.3, 0.15, 1])
-    theme_btn_safe = ListProperty([0.2, 0.45, 0.25, 1])
-    theme_btn_warning = ListProperty([0.55, 0.35, 0.1, 1])
-    theme_btn_clear = ListProperty([0.5, 0.25, 0.2, 1])
-    theme_btn_generate = ListProperty([0.25, 0.45, 0.55, 1])
-    theme_btn_apply = ListProperty([0.2, 0.5, 0.3, 1])
-    theme_btn_reset = ListProperty([0.5, 0.25, 0.2, 1])
-    theme_btn_map = ListProperty([0.2, 0.3, 0.4, 1])
-    theme_btn_toggle_on = ListProperty([0.15, 0.5, 0.2, 1])
-    theme_btn_toggle_off = ListProperty([0.6, 0.18, 0.18, 1])
-    theme_btn_nav_active = ListProperty([0.2, 0.4, 0.7, 1])
-    theme_tile_default = ListProperty([0.18, 0.18, 0.22, 1])
-    theme_tile_border = ListProperty([0.3, 0.3, 0.35, 1])
+    theme_bg_root = ColorProperty([0.12, 0.12, 0.14, 1])
+    theme_bg_navbar = ColorProperty([0.15, 0.15, 0.18, 1])
+    theme_bg_input = ColorProperty([0.2, 0.2, 0.25, 1])
+    theme_bg_spinner = ColorProperty([0.25, 0.25, 0.3, 1])
+    theme_bg_status_log = ColorProperty([0.08, 0.08, 0.1, 1])
+    theme_text_primary = ColorProperty([1, 1, 1, 1])
+    theme_text_title = ColorProperty([0.8, 0.85, 0.9, 1])
+    theme_text_label = ColorProperty([0.7, 0.7, 0.7, 1])
+    theme_text_settings = ColorProperty([0.65, 0.65, 0.7, 1])
+    theme_text_tile_label = ColorProperty([0.55, 0.6, 0.65, 1])
+    theme_text_section = ColorProperty([0.45, 0.48, 0.52, 1])
+    theme_text_dim = ColorProperty([0.4, 0.4, 0.4, 1])
+    theme_text_detail = ColorProperty([0.6, 0.6, 0.6, 1])
+    theme_text_feedback = ColorProperty([0.5, 0.7, 0.5, 1])
+    theme_text_cmd_feedback = ColorProperty([0.5, 0.6, 0.7, 1])
+    theme_text_status_log = ColorProperty([0.6, 0.7, 0.65, 1])
+    theme_text_mode_display = ColorProperty([0.6, 0.65, 0.7, 1])
+
+    theme_text_last_update = ColorProperty([0.5, 0.5, 0.5, 1])
+    theme_text_formula = ColorProperty([0.5, 0.55, 0.6, 1])
+    theme_btn_connect = ColorProperty([0.2, 0.55, 0.3, 1])
+    theme_btn_action = ColorProperty([0.25, 0.35, 0.5, 1])
+    theme_btn_danger = ColorProperty([0.7, 0.3, 0.15, 1])
+    theme_btn_safe = ColorProperty([0.2, 0.45, 0.25, 1])
+    theme_btn_warning = ColorProperty([0.55, 0.35, 0.1, 1])
+    theme_btn_clear = ColorProperty([0.5, 0.25, 0.2, 1])
+    theme_btn_generate = ColorProperty([0.25, 0.45, 0.55, 1])
+    theme_btn_apply = ColorProperty([0.2, 0.5, 0.3, 1])
+    theme_btn_reset = ColorProperty([0.5, 0.25, 0.2, 1])
+    theme_btn_map = ColorProperty([0.2, 0.3, 0.4, 1])
+    theme_btn_toggle_on = ColorProperty([0.15, 0.5, 0.2, 1])
+    theme_btn_toggle_off = ColorProperty([0.6, 0.18, 0.18, 1])
+    theme_btn_nav_active = ColorProperty([0.2, 0.4, 0.7, 1])
+    theme_tile_default = ColorProperty([0.18, 0.18, 0.22, 1])
+    theme_tile_border = ColorProperty([0.3, 0.3, 0.35, 1])
+
+    # Color keys pushed by apply_theme(); each maps to the theme_<key>
+    # ColorProperty above.
+    _THEME_KEYS = (
+        "bg_root",
+        "bg_navbar",
+        "bg_input",
+        "bg_spinner",
+        "bg_status_log",
+        "text_primary",
+        "text_title",
+        "text_label",
+        "text_settings",
+        "text_tile_label",
+        "text_section",
+        "text_dim",
+        "text_detail",
+        "text_feedback",
+        "text_cmd_feedback",
+        "text_status_log",
+        "text_mode_display",
+        "text_last_update",
+        "text_formula",
+        "btn_connect",
+        "btn_action",
+        "btn_danger",
+        "btn_safe",
+        "btn_warning",
+        "btn_clear",
+        "btn_generate",
+        "btn_apply",
+        "btn_reset",
+        "btn_map",
+        "btn_toggle_on",
+        "btn_toggle_off",
+        "btn_nav_active",
+        "tile_default",
+        "tile_border",
+    )
 
     def apply_theme(self):
-        """Push all theme colors from current theme dict into ListProperties."""
-        self.theme_bg_root = list(get_color("bg_root"))
-        self.theme_bg_navbar = list(get_color("bg_navbar"))
-        self.theme_bg_input = list(get_color("bg_input"))
-        self.theme_bg_spinner = list(get_color("bg_spinner"))
-        self.theme_bg_status_log = list(get_color("bg_status_log"))
-        self.theme_text_primary = list(get_color("text_primary"))
-        self.theme_text_title = list(get_color("text_title"))
-        self.theme_text_label = list(get_color("text_label"))
-        self.theme_text_settings = list(get_color("text_settings"))
-        self.theme_text_tile_label = list(get_color("text_tile_label"))
-        self.theme_text_section = list(get_color("text_section"))
-        self.theme_text_dim = list(get_color("text_dim"))
-        self.theme_text_detail = list(get_color("text_detail"))
-        self.theme_text_feedback = list(get_color("text_feedback"))
-        self.theme_text_cmd_feedback = list(get_color("text_cmd_feedback"))
-        self.theme_text_status_log = list(get_color("text_status_log"))
-        self.theme_text_mode_display = list(get_color("text_mode_display"))
-
-        self.theme_text_last_update = list(get_color("text_last_update"))
-        self.theme_text_formula = list(get_color("text_formula"))
-        self.theme_btn_connect = list(get_color("btn_connect"))
-        self.theme_btn_action = list(get_color("btn_action"))
-        self.theme_btn_danger = list(get_color("btn_danger"))
-        self.theme_btn_safe = list(get_color("btn_safe"))
-        self.theme_btn_warning = list(get_color("btn_warning"))
-        self.theme_btn_clear = list(get_color("btn_clear"))
-        self.theme_btn_generate = list(get_color("btn_generate"))
-        self.theme_btn_apply = list(get_color("btn_apply"))
-        self.theme_btn_reset = list(get_color("btn_reset"))
-        self.theme_btn_map = list(get_color("btn_map"))
-        self.theme_btn_toggle_on = list(get_color("btn_toggle_on"))
-        self.theme_btn_toggle_off = list(get_color("btn_toggle_off"))
-        self.theme_btn_nav_active = list(get_color("btn_nav_active"))
-        self.theme_tile_default = list(get_color("tile_default"))
-        self.theme_tile_border = list(get_color("tile_border"))
+        """Push all theme colors from current theme dict into ColorProperties."""
+        # One dict fetch per switch; Kivy skips the dispatch for any
+        # color that is the same in both themes.
+        colors = get_theme_dict()
+        for key in self._THEME_KEYS:
+            # ColorProperty takes the theme's RGBA tuple as-is
+            setattr(self, "theme_" + key, colors.get(key, MISSING_COLOR))
         # Re-highlight the active nav button after theme change
         self._update_nav_buttons()
 
+    def mark_settings_dirty(self):
+        """Flag settings_data as changed; it is flushed after a short delay.
+
+        Several changes within SETTINGS_SAVE_DELAY_S share one write.
+        """
+        if not self._settings_dirty:
+            self._settings_dirty = True
+            Clock.schedule_once(lambda dt: self.save_settings_if_dirty(),
+                                SETTINGS_SAVE_DELAY_S)
+
+    def save_settings_if_dirty(self):
+        """Write settings_data only if it changed since the last flush."""
+        if self._settings_dirty:
+            _save_settings(self.settings_data, self.settings_path)
+            self._settings_dirty = False
+
     def set_app_theme(self, name):
         """Switch theme, persist choice, and refresh UI."""
         set_theme(name)
         self.settings_data["theme"] = name
-        _save_settings(self.settings_data)
+        self.mark_settings_dirty()
         self.apply_theme()
 
     def build(self):
+        # Resolve the settings file location once and make sure its folder
+        # exists, so later saves don't repeat the path join + mkdir.
+        # Best-effort: on Android the folder may not be creatable until
+        # storage permission is granted (_on_storage_ready retries it).
+        self.settings_path = _settings_path()
+        try:
+            os.makedirs(os.path.dirname(self.settings_path), exist_ok=True)
+        except OSError:
+            log.warning("Cannot create settings folder for %s",
+                        self.settings_path)
+
         # Load persisted settings (connection, thresholds, theme, etc.)
-        self.settings_data = _load_settings()
+        self.settings_data = _load_settings(self.settings_path)
+        self._settings_dirty = False  # see mark_settings_dirty()
 
         # Apply persisted theme before any widget is created
         theme_name = self.settings_data.get("theme", "dark")
@@ -1735,8 +2109,10 @@ class CopterSondeGCSApp(App):
             event_bus=self.event_bus,
         )
 
-        # Clock event handle for the periodic UI refresh loop
+        # Clock event handle for the periodic UI refresh loop and the
+        # rate it was scheduled at (see set_ui_rate)
         self.update_event = None
+        self._current_hz = 0
 
         # Restore persisted wind coefficients for both real and sim clients
         wind = self.settings_data.get("wind_coeffs", {})
@@ -1764,18 +2140,27 @@ class CopterSondeGCSApp(App):
         "settings": 0.5,     # ~2 Hz — user-driven changes only
     }
 
+    # ── Lazy screen construction ─────────────────────────────────────
+    # Only the connection and flight screens are built at startup.  The
+    # rest run their KV rules (and allocate their widget trees) the first
+    # time the user navigates to them, which shortens time-to-first-frame.
+    _SCREEN_FACTORIES = {
+        "connection": ConnectionScreen,
+        "flight": FlightScreen,
+        "sensor_plots": SensorPlotScreen,
+        "profile": ProfileScreen,
+        "map": MapScreen,
+        "params": ParamsScreen,
+        "settings": SettingsScreen,
+    }
+    _EAGER_SCREENS = ("connection", "flight")
+
     def on_start(self):
         """Called after build -- the widget tree from KV is ready."""
-        # Add all screens to the ScreenManager (order = swipe order)
         sm = self.root.ids.sm
         sm.transition = SlideTransition(duration=0.2)
-        sm.add_widget(ConnectionScreen(name="connection"))
-        sm.add_widget(FlightScreen(name="flight"))
-        sm.add_widget(SensorPlotScreen(name="sensor_plots"))
-        sm.add_widget(ProfileScreen(name="profile"))
-        sm.add_widget(MapScreen(name="map"))
-        sm.add_widget(ParamsScreen(name="params"))
-        sm.add_widget(SettingsScreen(name="settings"))
+        for name in self._EAGER_SCREENS:
+            sm.add_widget(self._SCREEN_FACTORIES[name](name=name))
         self.sm = sm
         # Tracks last update time per screen for rate throttling
         self._screen_last_update = {}
@@ -1836,7 +2221,10 @@ class CopterSondeGCSApp(App):
         log.info("App storage folder ready: %s", base)
 
     def switch_screen(self, name):
-        self.root.ids.sm.current = name
+        sm = self.root.ids.sm
+        if not sm.has_screen(name):
+            sm.add_widget(self._SCREEN_FACTORIES[name](name=name))
+        sm.current = name
         self._update_nav_buttons()
 
     def _update_nav_buttons(self):
@@ -1854,6 +2242,15 @@ class CopterSondeGCSApp(App):
                 else:
                     btn.background_color = self.theme_bg_input
 
+    def set_ui_rate(self, hz):
+        """(Re)schedule update_ui() at *hz*; no-op if already at that rate."""
+        if self.update_event is not None:
+            if hz == self._current_hz:
+                return
+            self.update_event.cancel()
+        self.update_event = Clock.schedule_interval(self.update_ui, 1.0 / hz)
+        self._current_hz = hz
+
     def update_ui(self, _dt):
         """Periodic UI refresh -- delegates to the current screen.
 
@@ -1861,7 +2258,20 @@ class CopterSondeGCSApp(App):
         tick (10 Hz).  Lower-priority screens are throttled per
         _SCREEN_INTERVALS to reduce CPU load on constrained hardware.
         Only the currently visible screen is updated to save resources.
+        While no vehicle heartbeat is heard the whole loop drops to
+        UI_IDLE_HZ, and returns to full rate once heartbeats resume.
+
+        The refresh is clock-driven rather than subscribed to DATA_UPDATED.
+        That event is emitted at most at 10 Hz and only after new packets
+        arrive, which is exactly why it can't drive the UI: link loss,
+        the flight timer and the connection screen's waiting counters all
+        have to advance while no packets arrive.  Ticks without new data
+        stay cheap because each screen returns early on an unchanged
+        signature.
         """
+        state = self.vehicle_state
+        state.healthy = state.is_healthy()
+        self.set_ui_rate(UI_UPDATE_HZ if state.healthy else UI_IDLE_HZ)
         screen = self.sm.current_screen
         if not hasattr(screen, "update"):
             return
@@ -1873,9 +2283,14 @@ class CopterSondeGCSApp(App):
             if now - last < interval:
                 return  # too soon — skip this tick
             self._screen_last_update[screen.name] = now
-        screen.update(self.vehicle_state)
+        screen.update(state)
 
     def on_pause(self):
+        # Android may kill a paused app without calling on_stop()
+        try:
+            self.save_settings_if_dirty()
+        except Exception:
+            log.exception("Failed to save settings on pause")
         return True
 
     def on_resume(self):
@@ -1883,6 +2298,10 @@ class CopterSondeGCSApp(App):
 
     def on_stop(self):
         log.info("Application stopping – cleaning up…")
+        try:
+            self.save_settings_if_dirty()
+        except Exception:
+            log.exception("Failed to save settings on stop")
         if self.update_event:
             self.update_event.cancel()
         self.mav_client.stop()
@@ -9,27 +9,67 @@ ADS-B targets, and scale bar are drawn on top.
 import math
 import os
 from collections import OrderedDict
+from functools import lru_cache
 from io import BytesIO
 
 from kivy.uix.widget import Widget
 from kivy.clock import Clock
-from kivy.graphics import Color, Rectangle, Line, Ellipse, Mesh
+from kivy.graphics import Canvas, Color, Rectangle, Line, Ellipse, Mesh
 from kivy.core.text import Label as CoreLabel
 from kivy.core.image import Image as CoreImage
 
 from app.tile_manager import (
     TileCache, TileDownloader,
-    lat_lon_to_pixel, TILE_SIZE, MIN_ZOOM, MAX_ZOOM, DEFAULT_ZOOM,
+    lat_lon_to_pixel, lat_lon_to_pixels, TILE_SIZE, MIN_ZOOM, MAX_ZOOM, DEFAULT_ZOOM,
 )
-from app.theme import get_color
+from app.theme import get_color, get_theme_name
 from gcs.logutil import get_logger
 
 log = get_logger("map_widget")
 
 _TEXT_CACHE_MAX = 150             # LRU text texture cache limit
+_TILE_TEX_CACHE_MAX = 400         # LRU tile texture cache limit
+_TILE_DECODES_PER_FRAME = 4       # new tile textures decoded per redraw
+# Prefetch along an axis when the heading has at least this component on
+# it (sin 22.5 deg: diagonal headings prefetch both a row and a column)
+_PREFETCH_AXIS_MIN = 0.38
+_PREFETCH_MEMORY = 2000           # prefetched tile keys remembered
+
+# Canvas layers, bottom to top, as bit flags for the dirty mask.  Each
+# layer is redrawn only when something it shows has changed.
+_LAYER_TILES = 1     # background + satellite/overlay tiles
+_LAYER_TRACK = 2     # flight track polyline
+_LAYER_MARKERS = 4   # ADS-B targets + drone
+_LAYER_OVERLAY = 8   # scale bar + info readout
+_ALL_LAYERS = _LAYER_TILES | _LAYER_TRACK | _LAYER_MARKERS | _LAYER_OVERLAY
 _MAX_TRACK_DRAW_POINTS = 300     # downsample track beyond this for performance
 
 
+@lru_cache(maxsize=_TEXT_CACHE_MAX)
+def _text_texture(text, font_size, color, bold):
+    """Render a text label to a texture (LRU-cached by its arguments)."""
+    lbl = CoreLabel(text=text, font_size=max(font_size, 8),
+                    color=color, bold=bold)
+    lbl.refresh()
+    return lbl.texture
+
+
+@lru_cache(maxsize=1024)
+def _arrow_offsets(hdg_deg, size):
+    """Vertex offsets (nose, left, right) of an arrowhead from its center.
+
+    Keyed by whole-degree heading and integer size, so the trig runs once
+    per distinct pose.  sin/cos because heading 0 = north = +Y on screen.
+    """
+    hdg = math.radians(hdg_deg)
+    wing = math.radians(140)  # rear wings sit 140 degrees back from the nose
+    return (math.sin(hdg) * size, math.cos(hdg) * size,
+            math.sin(hdg + wing) * size * 0.65,
+            math.cos(hdg + wing) * size * 0.65,
+            math.sin(hdg - wing) * size * 0.65,
+            math.cos(hdg - wing) * size * 0.65)
+
+
 def _cache_base():
     """Return a writable cache directory for map tiles."""
     try:
@@ -51,10 +91,20 @@ class MapWidget(Widget):
         self._heading = 0.0
         self._track = []       # [(lat, lon), ...] flight breadcrumbs
         self._adsb = []        # [(callsign, lat, lon, alt_m, heading), ...]
+        # Downsampling indices for the track, reused while its length is
+        # unchanged (it stops growing once the history buffer is full)
+        self._track_idx = range(0)
+        self._track_idx_n = 0
         # Map viewport center (may diverge from drone if centering is off)
         self._center_lat = 0.0
         self._center_lon = 0.0
         self._zoom = DEFAULT_ZOOM  # integer tile zoom level
+        # Viewport center in global Mercator pixels, set once per redraw
+        self._cxg = 0.0
+        self._cyg = 0.0
+        # Global-to-widget offsets derived from the above (see _geo_to_px)
+        self._ccx = 0.0
+        self._ccy = 0.0
         self._center_on_drone = True
         self._show_track = True
         self._show_adsb = True
@@ -70,16 +120,33 @@ class MapWidget(Widget):
             on_tile_ready=self._on_tiles_ready,
         )
         # GPU texture cache — converts raw PNG/JPEG bytes to Kivy Textures
-        self._tile_tex_cache = {}  # (layer, z, x, y) -> Kivy Texture
-        self._text_cache = OrderedDict()  # LRU text texture cache
-
-        # Dirty-flag coalescing pattern (same as HUD/Plot widgets)
-        self._dirty = True
+        self._tile_tex_cache = OrderedDict()  # (layer, z, x, y) -> Texture, LRU
+        self._prefetched = set()  # (z, x, y) already sent to the downloader
+        # Tile decodes left in the current redraw; see _get_tile_tex()
+        self._decode_budget = 0
+        self._decode_deferred = False
+        # Tiles whose cached bytes failed to decode; not retried, so a
+        # corrupt tile can't use up the decode budget every frame
+        self._bad_tiles = set()  # (layer, z, x, y)
+
+        # One sub-canvas per layer, stacked in draw order
+        self._layers = {}
+        for layer in (_LAYER_TILES, _LAYER_TRACK,
+                      _LAYER_MARKERS, _LAYER_OVERLAY):
+            self._layers[layer] = Canvas()
+            self.canvas.add(self._layers[layer])
+        self._drawn_track = None  # (len, last point) the track layer shows
+        self._drawn_pose = None   # rounded (lat, lon, heading) last drawn
+        self._drawn_theme = None
+
+        # Dirty-flag coalescing pattern (same as HUD/Plot widgets), with
+        # _dirty holding a mask of the layers that need redrawing
+        self._dirty = _ALL_LAYERS
         self._redraw_scheduled = False
         self.bind(pos=self._mark_dirty, size=self._mark_dirty)
 
-    def _mark_dirty(self, *_args):
-        self._dirty = True
+    def _mark_dirty(self, *_args, layers=_ALL_LAYERS):
+        self._dirty |= layers
         if not self._redraw_scheduled:
             self._redraw_scheduled = True
             Clock.schedule_once(self._do_redraw, 0)
@@ -87,23 +154,43 @@ class MapWidget(Widget):
     def _do_redraw(self, _dt=None):
         self._redraw_scheduled = False
         if self._dirty:
-            self._dirty = False
-            self._redraw()
+            layers = self._dirty
+            self._dirty = 0
+            self._redraw(layers)
 
     # -----------------------------------------------------------------
     # Public API
     # -----------------------------------------------------------------
 
     def set_state(self, lat, lon, heading, track, adsb_targets):
+        layers = 0
+        # Pose rounded to ~0.1 m and 1 degree: finer changes are below a
+        # pixel even at max zoom and below the info readout's precision
+        pose = (round(lat, 6), round(lon, 6), round(heading))
+        moved = pose != self._drawn_pose
+        if moved:
+            self._drawn_pose = pose
+            layers |= _LAYER_MARKERS | _LAYER_OVERLAY
+        # The caller extends one list in place, so compare length and
+        # newest point rather than identity
+        if (len(track), track[-1] if track else None) != self._drawn_track:
+            layers |= _LAYER_TRACK
+        if adsb_targets is not self._adsb:
+            layers |= _LAYER_MARKERS
         self._lat = lat
         self._lon = lon
         self._heading = heading
         self._track = track
         self._adsb = adsb_targets
-        if self._center_on_drone and (lat != 0 or lon != 0):
+        # The center only follows visible moves, so every layer stays drawn
+        # against the same viewport
+        if moved and self._center_on_drone and (lat != 0 or lon != 0):
+            if (lat, lon) != (self._center_lat, self._center_lon):
+                layers = _ALL_LAYERS  # viewport moved: everything shifts
             self._center_lat = lat
             self._center_lon = lon
-        self._mark_dirty()
+        if layers:
+            self._mark_dirty(layers=layers)
 
     def zoom_in(self):
         if self._zoom < MAX_ZOOM:
@@ -117,15 +204,16 @@ class MapWidget(Widget):
 
     def toggle_center(self):
         self._center_on_drone = not self._center_on_drone
+        self._drawn_pose = None  # re-center on the next set_state()
 
     def toggle_track(self):
         self._show_track = not self._show_track
-        self._mark_dirty()
+        self._mark_dirty(layers=_LAYER_TRACK)
         return self._show_track
 
     def toggle_adsb(self):
         self._show_adsb = not self._show_adsb
-        self._mark_dirty()
+        self._mark_dirty(layers=_LAYER_MARKERS)
         return self._show_adsb
 
     # -----------------------------------------------------------------
@@ -134,7 +222,7 @@ class MapWidget(Widget):
 
     def _on_tiles_ready(self):
         """Called on main thread when new tiles arrive."""
-        self._mark_dirty()
+        self._mark_dirty(layers=_LAYER_TILES)
 
     # -----------------------------------------------------------------
     # Coordinate conversion (Spherical Mercator -> Kivy pixels)
@@ -144,14 +232,15 @@ class MapWidget(Widget):
     # the two coordinate systems.
 
     def _geo_to_px(self, lat, lon):
-        """Convert lat/lon to widget pixel coordinates."""
-        cxg, cyg = lat_lon_to_pixel(
-            self._center_lat, self._center_lon, self._zoom)
+        """Convert lat/lon to widget pixel coordinates.
+
+        Only valid during _redraw(), which sets the cached viewport
+        center and its offsets (_ccx, _ccy) for the current zoom.
+        """
         pxg, pyg = lat_lon_to_pixel(lat, lon, self._zoom)
         # X: same direction in both systems (east = right)
         # Y: negate delta because Kivy Y-up vs Mercator Y-down
-        return (self.center_x + (pxg - cxg),
-                self.center_y - (pyg - cyg))
+        return self._ccx + pxg, self._ccy - pyg
 
     # -----------------------------------------------------------------
     # Texture helpers
@@ -162,14 +251,28 @@ class MapWidget(Widget):
 
         Converts raw image bytes from the tile cache into a GPU texture.
         Textures are cached to avoid repeated decoding of the same tile.
+        Decoding runs on the UI thread, so only _TILE_DECODES_PER_FRAME
+        tiles are decoded per redraw; past that this returns False (tile
+        deferred or undecodable, don't request it) rather than None (tile
+        not downloaded yet).
         """
         key = (layer, z, x, y)
-        if key in self._tile_tex_cache:
-            return self._tile_tex_cache[key]
+        tex = self._tile_tex_cache.get(key)
+        if tex is not None:
+            self._tile_tex_cache.move_to_end(key)
+            return tex
+        if key in self._bad_tiles:
+            return False
+        # Look the bytes up before the budget test so tiles that still
+        # need downloading are requested even on a busy frame
         cache = self._sat_cache if layer == "sat" else self._ovl_cache
         data = cache.get(z, x, y)
         if data is None:
             return None
+        if self._decode_budget <= 0:
+            self._decode_deferred = True
+            return False
+        self._decode_budget -= 1
         try:
             # Detect image format from magic bytes (JPEG vs PNG)
             if data[:3] == b'\xff\xd8\xff':
@@ -178,33 +281,20 @@ class MapWidget(Widget):
                 ext = "png"
             tex = CoreImage(BytesIO(data), ext=ext).texture
             self._tile_tex_cache[key] = tex
-            # Evict oldest 100 textures when cache exceeds 400
-            if len(self._tile_tex_cache) > 400:
-                keys = list(self._tile_tex_cache.keys())
-                for k in keys[:100]:
-                    del self._tile_tex_cache[k]
+            if len(self._tile_tex_cache) > _TILE_TEX_CACHE_MAX:
+                self._tile_tex_cache.popitem(last=False)
             return tex
         except Exception:
-            return None
+            log.warning("Failed to decode %s tile %d/%d/%d", layer, z, x, y)
+            self._bad_tiles.add(key)
+            return False
 
     # -----------------------------------------------------------------
     # Text helpers (cached)
     # -----------------------------------------------------------------
 
     def _tex(self, text, font_size, color=(1, 1, 1, 1), bold=False):
-        key = (str(text), int(font_size), tuple(color), bold)
-        tex = self._text_cache.get(key)
-        if tex is not None:
-            self._text_cache.move_to_end(key)
-            return tex
-        lbl = CoreLabel(text=str(text), font_size=max(font_size, 8),
-                        color=color, bold=bold)
-        lbl.refresh()
-        tex = lbl.texture
-        self._text_cache[key] = tex
-        if len(self._text_cache) > _TEXT_CACHE_MAX:
-            self._text_cache.popitem(last=False)
-        return tex
+        return _text_texture(str(text), int(font_size), tuple(color), bold)
 
     def _draw_tex(self, tex, x, y):
         Color(1, 1, 1, 1)
@@ -214,36 +304,66 @@ class MapWidget(Widget):
     # Main draw
     # -----------------------------------------------------------------
 
-    def _redraw(self, *_args):
-        self.canvas.clear()
+    def _redraw(self, layers=_ALL_LAYERS):
         w, h = self.size
         if w < 40 or h < 40:
+            for canvas in self._layers.values():
+                canvas.clear()
             return
 
-        with self.canvas:
-            # Dark background (visible where tiles haven't loaded)
-            Color(*get_color("bg_map"))
-            Rectangle(pos=self.pos, size=self.size)
-
-            # Satellite + overlay tiles
-            self._draw_tiles(w, h)
-
-            # Flight track
-            if self._show_track and len(self._track) >= 2:
-                self._draw_track(w, h)
-
-            # ADS-B targets
-            if self._show_adsb:
-                self._draw_adsb(w, h)
+        # Colors are read while drawing, so a theme switch redraws all
+        theme = get_theme_name()
+        if theme != self._drawn_theme:
+            self._drawn_theme = theme
+            layers = _ALL_LAYERS
 
-            # Drone marker
-            self._draw_drone(w, h)
-
-            # Scale bar
-            self._draw_scale(w, h)
-
-            # Info overlay
-            self._draw_info(w, h)
+        # The viewport center is the same for every tile and marker drawn
+        # below; project it once per redraw.
+        self._cxg, self._cyg = lat_lon_to_pixel(
+            self._center_lat, self._center_lon, self._zoom)
+        self._ccx = self.center_x - self._cxg
+        self._ccy = self.center_y + self._cyg
+
+        if layers & _LAYER_TILES:
+            canvas = self._layers[_LAYER_TILES]
+            canvas.clear()
+            with canvas:
+                # Dark background (visible where tiles haven't loaded)
+                Color(*get_color("bg_map"))
+                Rectangle(pos=self.pos, size=self.size)
+
+                # Satellite + overlay tiles
+                self._draw_tiles(w, h)
+
+        if layers & _LAYER_TRACK:
+            canvas = self._layers[_LAYER_TRACK]
+            canvas.clear()
+            track = self._track
+            self._drawn_track = (len(track), track[-1] if track else None)
+            if self._show_track and len(track) >= 2:
+                with canvas:
+                    self._draw_track(w, h)
+
+        if layers & _LAYER_MARKERS:
+            canvas = self._layers[_LAYER_MARKERS]
+            canvas.clear()
+            with canvas:
+                # ADS-B targets
+                if self._show_adsb:
+                    self._draw_adsb(w, h)
+
+                # Drone marker
+                self._draw_drone(w, h)
+
+        if layers & _LAYER_OVERLAY:
+            canvas = self._layers[_LAYER_OVERLAY]
+            canvas.clear()
+            with canvas:
+                # Scale bar
+                self._draw_scale(w, h)
+
+                # Info overlay
+                self._draw_info(w, h)
 
     def _draw_tiles(self, w, h):
         """Render visible satellite + overlay map tiles.
@@ -253,8 +373,7 @@ class MapWidget(Widget):
         them.  Missing tiles are requested from the downloader.
         """
         z = self._zoom
-        cxg, cyg = lat_lon_to_pixel(
-            self._center_lat, self._center_lon, z)
+        cxg, cyg = self._cxg, self._cyg
 
         # Visible area in global Mercator pixel coordinates
         left_g = cxg - w / 2
@@ -269,113 +388,219 @@ class MapWidget(Widget):
         ty_max = min(2 ** z - 1, int(bot_g // TILE_SIZE) + 1)
         max_t = 2 ** z  # total tiles in one row at this zoom
 
-        for ty in range(ty_min, ty_max + 1):
-            for tx in range(tx_min, tx_max + 1):
-                # Wrap X for world-wrapping (tiles repeat past antimeridian)
-                txw = tx % max_t
-                if txw < 0:
-                    txw += max_t
-
-                # Tile NW corner in global Mercator pixels
-                tile_gx = tx * TILE_SIZE
-                tile_gy = ty * TILE_SIZE
-
-                # Convert to Kivy widget coords (Y-up, tile origin is NW)
-                sx = self.center_x + (tile_gx - cxg)
-                # Subtract TILE_SIZE because tile origin is top-left but
-                # Kivy Rectangle pos is bottom-left
-                sy = self.center_y - (tile_gy - cyg) - TILE_SIZE
-
+        # Per-column and per-row values are computed once, outside the
+        # tile loop.  Column: (wrapped tile X, widget x); X wraps for
+        # world-wrapping (tiles repeat past the antimeridian, and Python's
+        # % already returns a non-negative result).  Row: (tile Y, widget
+        # y); the tile origin is its NW corner but a Kivy Rectangle's pos
+        # is bottom-left, hence the extra -TILE_SIZE, and Y is negated
+        # because Kivy is Y-up while Mercator is Y-down.
+        base_sx = self.center_x - cxg
+        base_sy = self.center_y + cyg - TILE_SIZE
+        cols = [(tx % max_t, base_sx + tx * TILE_SIZE)
+                for tx in range(tx_min, tx_max + 1)]
+        rows = [(ty, base_sy - ty * TILE_SIZE)
+                for ty in range(ty_min, ty_max + 1)]
+
+        get_tex = self._get_tile_tex
+        request = self._downloader.request
+        loading_color = get_color("bg_map_loading")
+        size = (TILE_SIZE, TILE_SIZE)
+        self._decode_budget = _TILE_DECODES_PER_FRAME
+        self._decode_deferred = False
+
+        # Sort tiles into placeholders, base and overlay textures first so
+        # each group is drawn under a single Color instruction.  Tiles
+        # never overlap, so drawing all base tiles before all overlays
+        # looks the same as interleaving them per tile.
+        placeholders = []
+        sat_tiles = []
+        ovl_tiles = []
+        for ty, sy in rows:
+            for txw, sx in cols:
+                pos = (sx, sy)
                 # Satellite base layer
-                sat_tex = self._get_tile_tex("sat", z, txw, ty)
+                sat_tex = get_tex("sat", z, txw, ty)
                 if sat_tex:
-                    Color(1, 1, 1, 1)
-                    Rectangle(texture=sat_tex, pos=(sx, sy),
-                              size=(TILE_SIZE, TILE_SIZE))
+                    sat_tiles.append((sat_tex, pos))
                 else:
                     # Dark placeholder while tile downloads in background
-                    Color(*get_color("bg_map_loading"))
-                    Rectangle(pos=(sx, sy), size=(TILE_SIZE, TILE_SIZE))
-                    self._downloader.request(z, txw, ty)
+                    # (or waits for a later frame's decode budget)
+                    placeholders.append(pos)
+                    if sat_tex is None:
+                        request(z, txw, ty)
 
                 # Road/label overlay (transparent PNG composited on top)
-                ovl_tex = self._get_tile_tex("ovl", z, txw, ty)
+                ovl_tex = get_tex("ovl", z, txw, ty)
                 if ovl_tex:
-                    Color(1, 1, 1, 1)
-                    Rectangle(texture=ovl_tex, pos=(sx, sy),
-                              size=(TILE_SIZE, TILE_SIZE))
+                    ovl_tiles.append((ovl_tex, pos))
+
+        if placeholders:
+            Color(*loading_color)
+            for pos in placeholders:
+                Rectangle(pos=pos, size=size)
+        Color(1, 1, 1, 1)
+        for tex, pos in sat_tiles:
+            Rectangle(texture=tex, pos=pos, size=size)
+        for tex, pos in ovl_tiles:
+            Rectangle(texture=tex, pos=pos, size=size)
+
+        # Tiles left undecoded this frame are picked up on the next one
+        if self._decode_deferred:
+            self._mark_dirty(layers=_LAYER_TILES)
+
+        # While following the drone, warm the cache one tile past the
+        # drawn grid in the direction of travel
+        if self._center_on_drone:
+            self._prefetch_ahead(z, tx_min, tx_max, ty_min, ty_max)
+
+    def _prefetch_ahead(self, z, tx_min, tx_max, ty_min, ty_max):
+        """Request the tile column/row just beyond the grid along the heading.
+
+        Each tile is requested once (the downloader skips tiles already on
+        disk), so the edge of the map is usually loaded before it scrolls
+        into view instead of flashing placeholders.
+        """
+        hdg = math.radians(self._heading)
+        east, north = math.sin(hdg), math.cos(hdg)
+        max_t = 2 ** z
+        tiles = []
+        if east > _PREFETCH_AXIS_MIN:
+            tiles += [(tx_max + 1, ty) for ty in range(ty_min, ty_max + 1)]
+        elif east < -_PREFETCH_AXIS_MIN:
+            tiles += [(tx_min - 1, ty) for ty in range(ty_min, ty_max + 1)]
+        # Mercator tile Y grows southwards
+        if north > _PREFETCH_AXIS_MIN and ty_min > 0:
+            tiles += [(tx, ty_min - 1) for tx in range(tx_min, tx_max + 1)]
+        elif north < -_PREFETCH_AXIS_MIN and ty_max < max_t - 1:
+            tiles += [(tx, ty_max + 1) for tx in range(tx_min, tx_max + 1)]
+
+        prefetched = self._prefetched
+        if len(prefetched) > _PREFETCH_MEMORY:
+            prefetched.clear()
+        request = self._downloader.request
+        for tx, ty in tiles:
+            key = (z, tx % max_t, ty)
+            if key not in prefetched:
+                prefetched.add(key)
+                request(*key)
 
     def _draw_track(self, w, h):
         """Draw flight track breadcrumbs (downsampled for performance).
 
         Long flights can accumulate thousands of GPS points.  Drawing
         all of them would be slow, so we uniformly downsample to at most
-        _MAX_TRACK_DRAW_POINTS while always keeping the latest point.
+        _MAX_TRACK_DRAW_POINTS while always keeping the latest point, and
+        skip segments that lie entirely off-screen.
         """
         Color(*get_color("map_track"))
         track = self._track
         n = len(track)
 
         # Downsample: take every Nth point to stay within budget
-        if n > _MAX_TRACK_DRAW_POINTS:
-            stride = n / _MAX_TRACK_DRAW_POINTS
-            indices = [int(i * stride) for i in range(_MAX_TRACK_DRAW_POINTS)]
-            if indices[-1] != n - 1:
-                indices.append(n - 1)  # always include latest point
-        else:
-            indices = range(n)
-
-        pts = []
-        for i in indices:
-            lat, lon = track[i]
-            px, py = self._geo_to_px(lat, lon)
-            pts.extend([px, py])
-        if len(pts) >= 4:
-            Line(points=pts, width=3.6)
+        if n != self._track_idx_n:
+            self._track_idx_n = n
+            if n > _MAX_TRACK_DRAW_POINTS:
+                stride = n / _MAX_TRACK_DRAW_POINTS
+                indices = [int(i * stride)
+                           for i in range(_MAX_TRACK_DRAW_POINTS)]
+                if indices[-1] != n - 1:
+                    indices.append(n - 1)  # always include latest point
+            else:
+                indices = range(n)
+            self._track_idx = indices
+        indices = self._track_idx
+
+        # Project the whole polyline in one batch, then shift into widget
+        # coords (Y negated: Kivy Y-up vs Mercator Y-down, see _geo_to_px)
+        pts = lat_lon_to_pixels([track[i] for i in indices], self._zoom)
+        ox, oy = self._ccx, self._ccy
+        pts[0::2] = [ox + x for x in pts[0::2]]
+        pts[1::2] = [oy - y for y in pts[1::2]]
+
+        # Cull segments whose bounding box misses the viewport; the runs
+        # that remain are drawn as separate lines, so zoomed in on a long
+        # flight only the on-screen part of the track reaches the GPU.
+        x_min, x_max = self.x - 10, self.x + w + 10
+        y_min, y_max = self.y - 10, self.y + h + 10
+        run = None
+        for i in range(0, len(pts) - 2, 2):
+            x0, y0, x1, y1 = pts[i:i + 4]
+            if ((x0 >= x_min or x1 >= x_min) and (x0 <= x_max or x1 <= x_max)
+                    and (y0 >= y_min or y1 >= y_min)
+                    and (y0 <= y_max or y1 <= y_max)):
+                if run is None:
+                    run = [x0, y0]
+                run += (x1, y1)
+            elif run is not None:
+                Line(points=run, width=3.6)
+                run = None
+        if run is not None:
+            Line(points=run, width=3.6)
+
+    @staticmethod
+    def _arrowhead_vertices(px, py, hdg_deg, size):
+        """Mesh vertices of an arrowhead at (px, py) pointing in hdg_deg.
+
+        The heading is rounded to a whole degree for the offset cache.
+        """
+        nx, ny, lx, ly, rx, ry = _arrow_offsets(round(hdg_deg) % 360,
+                                                int(size))
+        # Mesh vertices: [x, y, u, v] per vertex — u/v unused (no texture)
+        return [px + nx, py + ny, 0, 0,
+                px + lx, py + ly, 0, 0,
+                px + rx, py + ry, 0, 0]
 
     def _draw_arrowhead(self, px, py, hdg_deg, size, rgba):
         """Draw a solid filled arrowhead at (px, py) pointing in hdg_deg.
 
         Uses Kivy's Mesh in triangle_fan mode for a GPU-filled triangle.
-        sin(hdg)/cos(hdg) because heading 0 = north = +Y in screen space.
         """
-        hdg = math.radians(hdg_deg)
-        # Nose (front tip) — points in heading direction
-        nx = px + math.sin(hdg) * size
-        ny = py + math.cos(hdg) * size
-        # Left rear wing — 140 degrees back from nose
-        lx = px + math.sin(hdg + math.radians(140)) * size * 0.65
-        ly = py + math.cos(hdg + math.radians(140)) * size * 0.65
-        # Right rear wing — symmetric on the other side
-        rx = px + math.sin(hdg - math.radians(140)) * size * 0.65
-        ry = py + math.cos(hdg - math.radians(140)) * size * 0.65
-
         Color(*rgba)
-        # Mesh vertices: [x, y, u, v] per vertex — u/v unused (no texture)
         Mesh(
-            vertices=[nx, ny, 0, 0, lx, ly, 0, 0, rx, ry, 0, 0],
+            vertices=self._arrowhead_vertices(px, py, hdg_deg, size),
             indices=[0, 1, 2],
             mode='triangle_fan',
         )
 
     def _draw_adsb(self, w, h):
         """Draw ADS-B target markers as solid red arrowheads."""
-        for callsign, lat, lon, alt_m, hdg in self._adsb:
-            px, py = self._geo_to_px(lat, lon)
-            if not (self.x - 60 <= px <= self.x + w + 60 and
-                    self.y - 60 <= py <= self.y + h + 60):
-                continue
-
-            # Solid red arrowhead pointing in heading direction
-            self._draw_arrowhead(px, py, hdg, 66, get_color("map_adsb"))
+        adsb = self._adsb
+        if not adsb:
+            return
+        # Project every target in one batch (see _draw_track), then cull
+        flat = lat_lon_to_pixels([(t[1], t[2]) for t in adsb], self._zoom)
+        ox, oy = self._ccx, self._ccy
+        x_min, x_max = self.x - 60, self.x + w + 60
+        y_min, y_max = self.y - 60, self.y + h + 60
+        visible = []
+        for i, (callsign, _, _, alt_m, hdg) in enumerate(adsb):
+            px = ox + flat[2 * i]
+            py = oy - flat[2 * i + 1]
+            if x_min <= px <= x_max and y_min <= py <= y_max:
+                visible.append((callsign, px, py, alt_m, hdg))
+        if not visible:
+            return
 
+        # All arrowheads share one color, so they go into a single
+        # triangle Mesh (one canvas instruction instead of one per target)
+        vertices = []
+        for _, px, py, _, hdg in visible:
+            vertices.extend(self._arrowhead_vertices(px, py, hdg, 66))
+        Color(*get_color("map_adsb"))
+        Mesh(vertices=vertices, indices=list(range(3 * len(visible))),
+             mode='triangles')
+
+        label_color = get_color("map_adsb_label")
+        label_bg = get_color("map_adsb_label_bg")
+        for callsign, px, py, alt_m, _ in visible:
             # Label with background box
             alt_ft = alt_m * 3.281
             label = f"{callsign} {alt_ft:.0f}ft"
-            tex = self._tex(label, 46, get_color("map_adsb_label"))
+            tex = self._tex(label, 46, label_color)
             lx = px + 36
             ly = py - tex.height / 2
-            Color(*get_color("map_adsb_label_bg"))
+            Color(*label_bg)
             Rectangle(pos=(lx - 3, ly - 2),
                       size=(tex.width + 6, tex.height + 4))
             self._draw_tex(tex, lx, ly)
@@ -218,6 +218,10 @@ THEME_NAMES = {"dark": "Dark", "high_contrast": "High Contrast"}
 # Module-level state — switched at runtime via set_theme()
 _current_theme = "dark"
 
+# Magenta fallback makes missing color keys immediately visible
+# during development without crashing the app.
+MISSING_COLOR = (1, 0, 1, 1)
+
 
 def set_theme(name):
     """Set the current theme by name."""
@@ -233,6 +237,9 @@ def get_theme_name():
 
 def get_color(name):
     """Return RGBA tuple for semantic color name in current theme."""
-    # Magenta fallback makes missing color keys immediately visible
-    # during development without crashing the app.
-    return THEMES[_current_theme].get(name, (1, 0, 1, 1))  # magenta = missing
+    return THEMES[_current_theme].get(name, MISSING_COLOR)
+
+
+def get_theme_dict():
+    """Return the color dict of the current theme (do not modify)."""
+    return THEMES[_current_theme]
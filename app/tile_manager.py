@@ -74,7 +74,7 @@ _MAX_LAT = 85.05112878  # Mercator latitude limit
 
 
 # ── Mercator projection helpers ─────────────────────────────────────
-# All three functions implement the standard Web Mercator (EPSG:3857)
+# These functions implement the standard Web Mercator (EPSG:3857)
 # formulas used by Google Maps, OSM, and ArcGIS tile servers.
 # px_x = (lon + 180) / 360 * 2^zoom * TILE_SIZE
 # px_y = (1 - asinh(tan(lat)) / pi) / 2 * 2^zoom * TILE_SIZE
@@ -94,6 +94,28 @@ def lat_lon_to_pixel(lat, lon, zoom):
     return px, py
 
 
+def lat_lon_to_pixels(points, zoom):
+    """Batch lat_lon_to_pixel for a sequence of (lat, lon) pairs.
+
+    Returns a flat [px0, py0, px1, py1, ...] list of global Mercator
+    pixels.  The zoom scale factors are computed once for the batch,
+    which matters for long polylines such as the flight track.
+    """
+    scale = 2.0 ** zoom * TILE_SIZE
+    kx = scale / 360.0
+    ky = scale / (2.0 * math.pi)
+    half = scale / 2.0
+    radians, tan, asinh = math.radians, math.tan, math.asinh
+    out = []
+    append = out.append
+    for lat, lon in points:
+        lat_c = -_MAX_LAT if lat < -_MAX_LAT else (
+            _MAX_LAT if lat > _MAX_LAT else lat)
+        append((lon + 180.0) * kx)
+        append(half - asinh(tan(radians(lat_c))) * ky)
+    return out
+
+
 def lat_lon_to_tile(lat, lon, zoom):
     """Convert lat/lon to tile (x, y) at given zoom."""
     n = 2.0 ** zoom
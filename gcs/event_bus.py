@@ -1,11 +1,13 @@
 """
 Kivy-adapted event bus for CopterSonde GCS.
 
-Provides thread-safe publish/subscribe.  Callbacks registered from the
-UI thread are dispatched on the main thread via ``Clock.schedule_once``
-so subscribers can safely update Kivy widgets.
+Provides thread-safe publish/subscribe.  Emitting only enqueues the
+event; a dedicated pump thread drains the queue and hands batches to the
+Kivy main thread via ``Clock.schedule_once`` so subscribers can safely
+update Kivy widgets.
 """
 
+import queue
 import threading
 from enum import Enum
 
@@ -30,11 +32,20 @@ class EventBus:
     Events are emitted from background threads (MAVLink IO, sim generator)
     but Kivy widgets can only be touched from the main thread.
     Clock.schedule_once bridges this gap safely.
+
+    emit() is a single queue put so the MAVLink RX thread never does
+    subscriber lookup or Clock scheduling itself; the "event-bus" pump
+    thread does that work and coalesces every event queued since its
+    last wake-up into one main-thread callback.
     """
 
     def __init__(self):
         self._subscribers: dict[EventType, list] = {}
         self._lock = threading.Lock()  # protects _subscribers dict
+        self._queue = queue.SimpleQueue()  # (event_type, data) from emit()
+        self._pump = threading.Thread(
+            target=self._pump_loop, name="event-bus", daemon=True)
+        self._pump.start()
 
     def subscribe(self, event_type: EventType, callback):
         with self._lock:
@@ -57,15 +68,37 @@ class EventBus:
             return bool(self._subscribers.get(event_type))
 
     def emit(self, event_type: EventType, data=None):
-        """Emit an event.  Callbacks run on the Kivy main thread."""
-        # Snapshot the callback list under the lock so we don't hold the
-        # lock while scheduling (which could deadlock if a callback
-        # tries to subscribe/unsubscribe).
-        with self._lock:
-            callbacks = list(self._subscribers.get(event_type, []))
-        for cb in callbacks:
-            # Clock.schedule_once defers execution to the next Kivy frame
-            # on the main thread — required because Kivy widgets are not
-            # thread-safe.  The default-arg trick (_cb=cb, _d=data) captures
-            # the current loop variable values to avoid late-binding issues.
-            Clock.schedule_once(lambda dt, _cb=cb, _d=data: _cb(_d), 0)
+        """Emit an event.  Callbacks run on the Kivy main thread.
+
+        Returns immediately — the event is only queued here and is
+        dispatched by the pump thread.
+        """
+        self._queue.put((event_type, data))
+
+    def _pump_loop(self):
+        """Drain queued events and forward them to the main thread."""
+        q = self._queue
+        while True:
+            batch = [q.get()]  # block until at least one event arrives
+            while True:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            # Resolve callbacks under the lock, but schedule outside it so
+            # a callback that subscribes/unsubscribes can't deadlock.
+            with self._lock:
+                calls = [(cb, data)
+                         for event_type, data in batch
+                         for cb in self._subscribers.get(event_type, ())]
+            if calls:
+                # One Clock callback per batch instead of one per
+                # subscriber per event.  The default-arg trick captures
+                # the current list to avoid late-binding issues.
+                Clock.schedule_once(
+                    lambda dt, _calls=calls: self._dispatch(_calls), 0)
+
+    @staticmethod
+    def _dispatch(calls):
+        for cb, data in calls:
+            cb(data)
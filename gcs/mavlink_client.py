@@ -7,9 +7,12 @@ object.  Emits events via the EventBus for UI subscribers.
 """
 
 import math
+import queue
 import threading
 import time
+from concurrent.futures import CancelledError, Future
 
+from kivy.clock import Clock
 from pymavlink import mavutil
 
 # Load custom MAVLink dialect that includes CASS_SENSOR_RAW (msg 227).
@@ -35,6 +38,7 @@ GCS_HEARTBEAT_INTERVAL_S = 1.0
 GCS_SYSID = 255   # conventional sysid for a ground control station
 GCS_COMPID = 190   # unique compid to avoid collisions with QGC (190)
 DATA_EMIT_INTERVAL_S = 0.1  # 10 Hz data event rate — matches UI refresh
+SEND_TIMEOUT_S = 2.0        # max wait for the IO thread to perform a send
 DEFAULT_STREAM_RATE_HZ = 10
 # Re-request streams every 5 s to survive autopilot reboots or packet loss
 STREAM_REQUEST_INTERVAL_S = 5.0
@@ -55,6 +59,13 @@ WS_B = 3.8
 log = get_logger("mavlink_client")
 
 
+def _send_error(future):
+    """Exception a finished send ended with, or None if it succeeded."""
+    if future.cancelled():
+        return CancelledError()
+    return future.exception()
+
+
 class MAVLinkClient:
     """
     Threaded MAVLink UDP client.
@@ -85,6 +96,14 @@ class MAVLinkClient:
         self._thread = None        # background IO thread
         self._stop_event = threading.Event()  # signals the IO loop to exit
         self.running = False
+        # Bumped once per received batch; DATA_UPDATED is only emitted
+        # when it has moved since the last emit
+        self._rx_version = 0
+
+        # Outbound sends requested from other threads (UI, command
+        # workers) are queued here and performed by the IO loop, so only
+        # one thread ever writes to the connection.
+        self._tx_queue = queue.SimpleQueue()
 
         # Connection string for pymavlink — format examples:
         #   "udpin:0.0.0.0:14550"  (listen for inbound UDP)
@@ -168,6 +187,7 @@ class MAVLinkClient:
         if self._thread is not None:
             self._thread.join(timeout=5.0)
             self._thread = None
+        self._fail_queued_sends()
         if self._conn is not None:
             self._conn.close()
             self._conn = None
@@ -198,41 +218,125 @@ class MAVLinkClient:
     # Command helpers
     # ------------------------------------------------------------------
 
+    def _send(self, fn, *args, on_done=None):
+        """Queue an outbound send for the IO thread and return at once.
+
+        pymavlink connections are not safe to write from several threads
+        (shared sequence counter and socket), so calls from anywhere but
+        the IO thread are queued and flushed on its next iteration.
+        Returns a Future for the send; it fails with ConnectionError if
+        the IO thread isn't running.  ``on_done(error)``, if given, is
+        called on the Kivy main thread with the send's exception (None on
+        success).  Failures are logged either way.
+        """
+        future = Future()
+        if on_done is not None:
+            future.add_done_callback(
+                lambda f: Clock.schedule_once(
+                    lambda _dt: on_done(_send_error(f)), 0))
+        thread = self._thread
+        if threading.current_thread() is thread:
+            self._run_send(future, fn, args)
+        elif thread is None or not thread.is_alive():
+            log.warning("MAVLink send dropped: IO thread is not running")
+            future.set_exception(
+                ConnectionError("MAVLink IO thread is not running"))
+        else:
+            self._tx_queue.put((future, fn, args))
+        return future
+
+    @staticmethod
+    def _run_send(future, fn, args):
+        # Skipped if the waiting worker already gave up (see _wait_sent)
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except Exception as exc:
+            log.exception("MAVLink send failed")
+            future.set_exception(exc)
+
+    @staticmethod
+    def _wait_sent(future):
+        """Block a worker thread until a queued send has gone out.
+
+        Raises the send's exception.  On timeout the send is cancelled,
+        so a command can't reach the vehicle after the worker has
+        reported failure.  Not for use on the UI thread.
+        """
+        if future is None:
+            raise ConnectionError("command not sent (not connected)")
+        try:
+            return future.result(timeout=SEND_TIMEOUT_S)
+        except Exception:
+            future.cancel()  # no-op once the send has run
+            raise
+
+    def _flush_sends(self):
+        """Run sends queued by other threads (IO thread only)."""
+        tx = self._tx_queue
+        run = self._run_send
+        while True:
+            try:
+                future, fn, args = tx.get_nowait()
+            except queue.Empty:
+                return
+            run(future, fn, args)
+
+    def _fail_queued_sends(self):
+        """Fail sends still queued once the IO thread has stopped."""
+        tx = self._tx_queue
+        while True:
+            try:
+                future, _fn, _args = tx.get_nowait()
+            except queue.Empty:
+                return
+            if future.set_running_or_notify_cancel():
+                future.set_exception(
+                    ConnectionError("MAVLink connection closed"))
+
+    # The helpers below return the Future from _send(), or None when
+    # nothing was queued (no connection, unknown mode).
+
     def send_command_long(self, command, p1=0, p2=0, p3=0, p4=0, p5=0, p6=0, p7=0):
         """Send a MAV_CMD via COMMAND_LONG."""
         if self._conn is None:
-            return
+            return None
         target_sys = self.last_sysid or 1
         target_comp = self.last_compid or 1
-        self._conn.mav.command_long_send(
+        return self._send(
+            self._conn.mav.command_long_send,
             target_sys, target_comp,
             command, 0,
             p1, p2, p3, p4, p5, p6, p7,
         )
 
     def arm(self):
-        self.send_command_long(
+        return self.send_command_long(
             mavutil.mavlink.MAV_CMD_COMPONENT_ARM_DISARM, p1=1
         )
 
     def disarm(self):
-        self.send_command_long(
+        return self.send_command_long(
             mavutil.mavlink.MAV_CMD_COMPONENT_ARM_DISARM, p1=0
         )
 
-    def set_mode(self, mode_name: str):
-        """Set flight mode by name (e.g. 'GUIDED', 'RTL', 'LAND')."""
+    def set_mode(self, mode_name: str, on_done=None):
+        """Set flight mode by name (e.g. 'GUIDED', 'RTL', 'LAND').
+
+        ``on_done`` is passed through to _send().
+        """
         if self._conn is None:
-            return
+            return None
         mode_map = self._conn.mode_mapping()
         if mode_name.upper() in mode_map:
             mode_id = mode_map[mode_name.upper()]
-            self._conn.set_mode(mode_id)
-        else:
-            log.warning("Unknown mode: %s", mode_name)
+            return self._send(self._conn.set_mode, mode_id, on_done=on_done)
+        log.warning("Unknown mode: %s", mode_name)
+        return None
 
     def takeoff(self, alt_m: float = 10.0):
-        self.send_command_long(
+        return self.send_command_long(
             mavutil.mavlink.MAV_CMD_NAV_TAKEOFF,
             p7=alt_m,
         )
@@ -240,12 +344,13 @@ class MAVLinkClient:
     def set_param(self, name: str, value: float, param_type=None):
         """Set an ArduPilot parameter."""
         if self._conn is None:
-            return
+            return None
         if param_type is None:
             param_type = mavutil.mavlink.MAV_PARAM_TYPE_REAL32
         # MAVLink param names are exactly 16 bytes, null-padded
         name_bytes = name.encode("utf-8").ljust(16, b"\x00")[:16]
-        self._conn.mav.param_set_send(
+        return self._send(
+            self._conn.mav.param_set_send,
             self.last_sysid or 1,
             self.last_compid or 1,
             name_bytes,
@@ -257,11 +362,12 @@ class MAVLinkClient:
         """Request all parameters from the autopilot via PARAM_REQUEST_LIST."""
         if self._conn is None:
             log.warning("request_all_params: no connection")
-            return
+            return None
         target_sys = self.last_sysid or 1
         target_comp = self.last_compid or 1
         log.info("Requesting all parameters from %d/%d", target_sys, target_comp)
-        self._conn.mav.param_request_list_send(target_sys, target_comp)
+        return self._send(self._conn.mav.param_request_list_send,
+                          target_sys, target_comp)
 
     def set_rc_override(self, channel: int, pwm_value: int):
         """Override a single RC channel (1-8).
@@ -270,14 +376,13 @@ class MAVLinkClient:
         watches RC7 for a high-PWM signal to start autonomous profiling.
         """
         if self._conn is None:
-            return
+            return None
         target_sys = self.last_sysid or 1
         target_comp = self.last_compid or 1
         rc_values = [0] * 8  # 0 = no change / release for other channels
         rc_values[channel - 1] = pwm_value
-        self._conn.mav.rc_channels_override_send(
-            target_sys, target_comp, *rc_values
-        )
+        return self._send(self._conn.mav.rc_channels_override_send,
+                          target_sys, target_comp, *rc_values)
 
     def trigger_autovp(self, target_altitude: float, on_done=None):
         """Write target altitude param and trigger AutoVP via RC7.
@@ -294,7 +399,8 @@ class MAVLinkClient:
 
                 # Step 1: Write target altitude to the Lua script's parameter
                 log.info("AutoVP: setting USR_AUTOVP_ALT = %.0f", target_altitude)
-                self.set_param("USR_AUTOVP_ALT", float(target_altitude))
+                self._wait_sent(
+                    self.set_param("USR_AUTOVP_ALT", float(target_altitude)))
                 time.sleep(0.5)  # allow param to propagate before RC trigger
 
                 # Step 2: Trigger via RC7 channel override — send repeatedly
@@ -303,13 +409,13 @@ class MAVLinkClient:
                 log.info("AutoVP: sending RC7 override (1900) for 1.5 s")
                 t_end = time.monotonic() + 1.5
                 while time.monotonic() < t_end:
-                    self.set_rc_override(7, 1900)
+                    self._wait_sent(self.set_rc_override(7, 1900))
                     time.sleep(0.1)
 
                 # Step 3: Release RC7 — send multiple times for reliability
                 log.info("AutoVP: releasing RC7 override (1100)")
                 for _ in range(5):
-                    self.set_rc_override(7, 1100)
+                    self._wait_sent(self.set_rc_override(7, 1100))
                     time.sleep(0.1)
 
                 log.info("AutoVP: mission generation triggered")
@@ -334,11 +440,11 @@ class MAVLinkClient:
             try:
                 # Sequence: LOITER (safe hover mode) -> ARM -> AUTO (mission start)
                 # Delays between steps give the autopilot time to acknowledge.
-                self.set_mode("LOITER")
+                self._wait_sent(self.set_mode("LOITER"))
                 time.sleep(2.0)
-                self.arm()
+                self._wait_sent(self.arm())
                 time.sleep(3.0)
-                self.set_mode("AUTO")
+                self._wait_sent(self.set_mode("AUTO"))
 
                 if on_done:
                     on_done(True, "Armed — Auto mission started")
@@ -373,6 +479,7 @@ class MAVLinkClient:
 
         last_gcs_hb = 0.0
         last_data_emit = 0.0
+        emitted_version = self._rx_version
 
         while not self._stop_event.is_set():
             now = time.monotonic()
@@ -390,17 +497,25 @@ class MAVLinkClient:
                         "(%.0fs elapsed, conn=%s)", elapsed, self._conn_str)
 
             # --- Receive: drain all pending messages (non-blocking) ---
-            # Process every queued packet before sleeping so we don't
-            # accumulate latency under high message rates.
+            # Collect every queued packet before sleeping so we don't
+            # accumulate latency under high message rates, then dispatch
+            # the whole batch in one call.
+            batch = []
+            recv = self._conn.recv_match
             while True:
                 try:
-                    msg = self._conn.recv_match(blocking=False)
+                    msg = recv(blocking=False)
                 except Exception:
                     log.exception("recv_match error")
                     msg = None
                 if msg is None:
                     break
-                self._handle_message(msg)
+                batch.append(msg)
+            if batch:
+                self._handle_batch(batch)
+
+            # --- Transmit: flush sends queued by other threads ---
+            self._flush_sends()
 
             # --- Transmit GCS heartbeat at 1 Hz ---
             if now - last_gcs_hb >= GCS_HEARTBEAT_INTERVAL_S:
@@ -415,12 +530,18 @@ class MAVLinkClient:
 
             # --- Emit data event at 10 Hz (only if someone is listening) ---
             # has_subscribers() check avoids snapshot() overhead when no
-            # UI screen is active (e.g. during settings or param editor).
-            if self.event_bus and now - last_data_emit >= DATA_EMIT_INTERVAL_S:
+            # UI screen is active (e.g. during settings or param editor),
+            # and nothing is emitted unless a batch arrived since the last
+            # emit.  The app's screens poll VehicleState on a Clock
+            # instead (see CopterSondeGCSApp.update_ui), since they must
+            # keep ticking when no packets arrive.
+            if (self.event_bus and now - last_data_emit >= DATA_EMIT_INTERVAL_S
+                    and self._rx_version != emitted_version):
                 if self.event_bus.has_subscribers(EventType.DATA_UPDATED):
                     self.event_bus.emit(EventType.DATA_UPDATED,
                                         self.state.snapshot())
                 last_data_emit = now
+                emitted_version = self._rx_version
 
             time.sleep(0.005)  # 5 ms sleep — balances CPU vs. latency
 
@@ -428,23 +549,48 @@ class MAVLinkClient:
     # Message handlers
     # ------------------------------------------------------------------
 
-    def _handle_message(self, msg):
-        """Dispatch a single MAVLink message to the appropriate handler.
+    def _handle_batch(self, msgs):
+        """Dispatch a batch of MAVLink messages to their handlers.
 
         Uses a dict-based dispatch table (_MSG_HANDLERS) instead of
         if/elif chains — O(1) lookup and easy to extend with new messages.
+        Repeats of the same overwrite-only message type within a batch
+        are coalesced to the newest one (see _COALESCED_MSGS), so a burst
+        from a lossy link is applied to the state in one pass.  Counter,
+        first-message bookkeeping and the version bump that releases the
+        next DATA_UPDATED run once per batch.
         """
-        self.msg_count += 1
+        self.msg_count += len(msgs)
         if self._first_msg_time is None:
             self._first_msg_time = time.monotonic()
             elapsed = self._first_msg_time - (self._connect_time or self._first_msg_time)
             log.info("First MAVLink message received after %.1fs: %s",
-                     elapsed, msg.get_type())
-
-        msg_type = msg.get_type()
-        handler = self._MSG_HANDLERS.get(msg_type)
-        if handler:
-            handler(self, msg)  # unbound method call — self passed explicitly
+                     elapsed, msgs[0].get_type())
+
+        # Walk the batch newest-first, dropping a coalesced message when a
+        # newer one of its type follows.  A message that reads another
+        # type's fields (_BATCH_READS) must see them as they were at its
+        # position, so it stops that type coalescing across it.
+        coalesced = self._COALESCED_MSGS
+        reads = self._BATCH_READS
+        seen = set()
+        keep = []
+        for msg in reversed(msgs):
+            msg_type = msg.get_type()
+            if msg_type in coalesced:
+                if msg_type in seen:
+                    continue
+                seen.add(msg_type)
+            keep.append((msg_type, msg))
+            if msg_type in reads:
+                seen.difference_update(reads[msg_type])
+
+        get_handler = self._MSG_HANDLERS.get
+        for msg_type, msg in reversed(keep):
+            handler = get_handler(msg_type)
+            if handler:
+                handler(self, msg)  # unbound method call — self passed explicitly
+        self._rx_version += 1
 
     def _on_heartbeat(self, msg):
         # Ignore heartbeats from other GCS instances (e.g. QGC)
@@ -551,10 +697,7 @@ class MAVLinkClient:
             text=msg.text,
             timestamp=time.time(),
         )
-        self.state.status_messages.append(sm)
-        # Cap status message list to avoid unbounded memory growth
-        if len(self.state.status_messages) > 200:
-            self.state.status_messages = self.state.status_messages[-200:]
+        self.state.status_messages.append(sm)  # bounded deque
         log.info("STATUSTEXT [%s]: %s", sm.severity_name, sm.text)
 
     def _on_command_ack(self, msg):
@@ -580,6 +723,7 @@ class MAVLinkClient:
             last_seen=time.monotonic(),
         )
         self.state.adsb_targets[t.icao] = t
+        self.state.adsb_version += 1
 
     def _on_cass_sensor_raw(self, msg):
         """Handle custom CASS_SENSOR_RAW (msg 227).
@@ -667,7 +811,7 @@ class MAVLinkClient:
             self.state.utc_time = msg.time_unix_usec / 1e6
 
     # Dispatch table — maps MAVLink message type strings to handler methods.
-    # Looked up in _handle_message() for O(1) dispatch.
+    # Looked up in _handle_batch() for O(1) dispatch.
     _MSG_HANDLERS = {
         "HEARTBEAT":           _on_heartbeat,
         "GLOBAL_POSITION_INT": _on_global_position_int,
@@ -685,6 +829,21 @@ class MAVLinkClient:
         "PARAM_VALUE":         _on_param_value,
     }
 
+    # Message types whose handlers unconditionally overwrite the same
+    # state fields, so only the newest one in a batch matters.  Handlers
+    # with conditional writes (GLOBAL_POSITION_INT heading, RC_CHANNELS
+    # rssi, SYSTEM_TIME utc), keyed upserts (ADSB_VEHICLE) or side effects
+    # (history, events, logging) see every message.
+    _COALESCED_MSGS = frozenset({
+        "ATTITUDE", "VFR_HUD", "SYS_STATUS", "GPS_RAW_INT",
+        "SERVO_OUTPUT_RAW",
+    })
+    # Coalesced types whose fields a handler reads: CASS_SENSOR_RAW
+    # snapshots wind (from ATTITUDE) and alt_amsl (VFR_HUD) into history.
+    _BATCH_READS = {
+        "CASS_SENSOR_RAW": ("ATTITUDE", "VFR_HUD"),
+    }
+
     def _send_gcs_heartbeat(self):
         try:
             self._conn.mav.heartbeat_send(
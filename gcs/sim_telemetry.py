@@ -113,6 +113,7 @@ class SimTelemetry:
                 speed_ms=random.uniform(50, 120),
                 last_seen=time.monotonic(),
             )
+        s.adsb_version += 1
 
     def _loop(self):
         """Main sim loop at ~10 Hz."""
@@ -242,3 +243,4 @@ class SimTelemetry:
             tgt.lon += random.uniform(-0.0001, 0.0001)
             tgt.heading = (tgt.heading + random.uniform(-2, 2)) % 360
             tgt.last_seen = time.monotonic()
+        s.adsb_version += 1
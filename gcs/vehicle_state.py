@@ -8,10 +8,13 @@ object; UI screens read from it on the main thread.
 Thread-safety note: individual field writes from the IO thread and reads
 from the UI thread are safe for Python built-in types (GIL guarantees
 atomic reference assignment).  The ``snapshot()`` method returns a plain
-dict for convenience.
+dict for convenience.  The history buffers are appended to as a group,
+so readers that need several of them (or ``h_count``) to agree hold
+``history_lock`` while reading.
 """
 
 import math
+import threading
 import time
 from collections import deque  # deque with maxlen gives O(1) append + auto-eviction
 from dataclasses import dataclass, field
@@ -37,6 +40,12 @@ class StatusMessage:
     severity_name: str = ""
     text: str = ""
     timestamp: float = 0.0
+    # Local "HH:MM:SS" of timestamp, formatted once here rather than by
+    # the UI on every status-log rebuild.
+    time_str: str = field(init=False, default="")
+
+    def __post_init__(self):
+        self.time_str = time.strftime("%H:%M:%S", time.localtime(self.timestamp))
 
 
 class VehicleState:
@@ -84,6 +93,9 @@ class VehicleState:
         self.flight_mode = "---"
         self.system_status = 0
         self.last_heartbeat = 0.0
+        # is_healthy() sampled once per UI tick by the app's update loop,
+        # so screens don't each recompute it (main thread only).
+        self.healthy = False
 
         # Sensors (CASS) — populated from custom CASS_SENSOR_RAW (msg 227)
         self.temperature_sensors: list[float] = []  # individual iMet probes (K)
@@ -99,9 +111,14 @@ class VehicleState:
 
         # ADS-B
         self.adsb_targets: dict[int, ADSBTarget] = {}
+        # Bumped by writers after any target is added or moved, so the map
+        # only rebuilds its target list when something changed.
+        self.adsb_version = 0
 
-        # Status messages
-        self.status_messages: list[StatusMessage] = []
+        # Status messages — capped at 200, oldest dropped on append.
+        # Appended on the IO thread; readers should copy what they need
+        # in one call (list(islice(...))) rather than index it twice.
+        self.status_messages: deque[StatusMessage] = deque(maxlen=200)
 
         # Throttle
         self.throttle = 0
@@ -126,11 +143,20 @@ class VehicleState:
         ]
         for k in self._history_keys:
             setattr(self, k, deque(maxlen=self.MAX_HISTORY))
+        # Total samples appended since the last clear (not capped at
+        # MAX_HISTORY) — lets screens convert only the newest samples.
+        self.h_count = 0
+        # Held while appending or clearing, so a screen that reads a
+        # sample range together with h_count sees one consistent
+        # snapshot rather than a half-finished append from the IO thread.
+        self.history_lock = threading.Lock()
 
     def clear_history(self):
         """Clear only history arrays, keep current-value fields."""
-        for k in self._history_keys:
-            setattr(self, k, deque(maxlen=self.MAX_HISTORY))
+        with self.history_lock:
+            for k in self._history_keys:
+                setattr(self, k, deque(maxlen=self.MAX_HISTORY))
+            self.h_count = 0
 
     def heartbeat_age(self):
         if self.last_heartbeat == 0.0:
@@ -156,22 +182,26 @@ class VehicleState:
     def append_history(self, data: dict):
         """Append one sample to the rolling history buffers.
 
-        Uses deque(maxlen) so eviction of old samples is O(1).
+        Uses deque(maxlen) so eviction of old samples is O(1).  Holds
+        history_lock so readers never see some deques appended to and
+        h_count not yet bumped.
         """
-        self.h_time.append(data.get("time_since_boot", 0))
-        self.h_lat.append(data.get("lat", 0))
-        self.h_lon.append(data.get("lon", 0))
-        self.h_alt_rel.append(data.get("alt_rel", 0))
-        self.h_alt_amsl.append(data.get("alt_amsl", 0))
-        self.h_temperature.append(data.get("temperature", 0))
-        self.h_humidity.append(data.get("humidity", 0))
-        self.h_dew_temp.append(data.get("dew_temp", 0))
-        self.h_wind_speed.append(data.get("wind_speed", 0))
-        self.h_wind_dir.append(data.get("wind_dir", 0))
-        self.h_vert_wind.append(data.get("vert_wind", 0))
-        self.h_temp_sensors.append(data.get("temp_sensors", []))
-        self.h_rh_sensors.append(data.get("rh_sensors", []))
-        self.h_vz.append(data.get("vz", 0))
+        with self.history_lock:
+            self.h_time.append(data.get("time_since_boot", 0))
+            self.h_lat.append(data.get("lat", 0))
+            self.h_lon.append(data.get("lon", 0))
+            self.h_alt_rel.append(data.get("alt_rel", 0))
+            self.h_alt_amsl.append(data.get("alt_amsl", 0))
+            self.h_temperature.append(data.get("temperature", 0))
+            self.h_humidity.append(data.get("humidity", 0))
+            self.h_dew_temp.append(data.get("dew_temp", 0))
+            self.h_wind_speed.append(data.get("wind_speed", 0))
+            self.h_wind_dir.append(data.get("wind_dir", 0))
+            self.h_vert_wind.append(data.get("vert_wind", 0))
+            self.h_temp_sensors.append(data.get("temp_sensors", []))
+            self.h_rh_sensors.append(data.get("rh_sensors", []))
+            self.h_vz.append(data.get("vz", 0))
+            self.h_count += 1
 
     def snapshot(self) -> dict:
         """Return a plain-dict snapshot of the most commonly needed fields.